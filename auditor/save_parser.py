@@ -69,6 +69,9 @@ class SaveFileData:
     engine_version: str = ""
     game_version: str = ""
     
+    # (transaction count, (sales, purchases)) - see _split_totals
+    _totals_cache: Optional[tuple] = field(default=None, repr=False, compare=False)
+    
     @property
     def current_money(self) -> float:
         """Get the actual current money amount."""
@@ -77,12 +80,34 @@ class SaveFileData:
     @property
     def total_purchases(self) -> float:
         """Total amount spent on purchases."""
-        return sum(t.amount for t in self.transactions if t.is_purchase)
+        return self._split_totals()[1]
     
     @property
     def total_sales(self) -> float:
         """Total amount earned from sales."""
-        return sum(t.amount for t in self.transactions if t.is_sale)
+        return self._split_totals()[0]
+    
+    def _split_totals(self) -> tuple[float, float]:
+        """Get (sales, purchases) from one pass over the raw scaled amounts.
+        
+        Sums stay in integers and are scaled once at the end. The result is
+        cached until the transaction count changes.
+        """
+        count = len(self.transactions)
+        if self._totals_cache is not None and self._totals_cache[0] == count:
+            return self._totals_cache[1]
+        
+        sales_raw = purchases_raw = 0
+        for t in self.transactions:
+            raw = t.amount_raw
+            if raw > 0:
+                sales_raw += raw
+            elif raw < 0:
+                purchases_raw += raw
+        
+        totals = (sales_raw / MONEY_SCALE, purchases_raw / MONEY_SCALE)
+        self._totals_cache = (count, totals)
+        return totals
 
 
 class SaveFileParser:
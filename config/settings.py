@@ -19,6 +19,9 @@ RESOURCES_DIR = APP_DIR / "resources"
 # Database
 DATABASE_NAME = "frontier_mining.db"
 DATABASE_PATH = DATA_DIR / DATABASE_NAME
+# Tracked seed copy (reference data); the working database is created from it
+# so runtime changes (including the WAL header) never touch a tracked file
+DATABASE_TEMPLATE_PATH = DATA_DIR / "frontier_mining_template.db"
 
 # Window Settings
 WINDOW_MIN_WIDTH = 1200
@@ -37,7 +40,7 @@ def ensure_directories():
 
 
 # Tab Configuration - defines the order and names of tabs
-TABS = [
+TABS = (
     ("Dashboard", "dashboard"),
     ("Ledger", "ledger"),
     ("Reference Data", "reference"),         # Combined: Items, Factory, Vehicles, Buildings, Recipes, Locations
@@ -48,7 +51,12 @@ TABS = [
     ("Material Movement", "material"),
     ("Budget Planner", "budget_planner"),
     ("Settings", "settings"),
-]
+)
+
+# Derived once at import: parallel name/id tuples and tab ID -> index lookup
+TAB_NAMES = tuple(name for name, _ in TABS)
+TAB_IDS = tuple(tab_id for _, tab_id in TABS)
+TAB_INDEX = {tab_id: i for i, tab_id in enumerate(TAB_IDS)}
 
 # Reference Data sub-tabs (for documentation):
 # - Items: Price tables, item rules, skill discounts
@@ -4,13 +4,14 @@ Database Module - SQLite database operations
 Handles all database creation, connections, and queries.
 """
 
+import shutil
 import sqlite3
 from pathlib import Path
 from datetime import date, datetime
 from typing import Optional
 from contextlib import contextmanager
 
-from config.settings import DATABASE_PATH, ensure_directories
+from config.settings import DATABASE_PATH, DATABASE_TEMPLATE_PATH, ensure_directories
 from core.models import (
     Transaction, 
     TransactionType, 
@@ -28,9 +29,16 @@ class Database:
     def __init__(self, db_path: Optional[Path] = None):
         """Initialize database connection."""
         self.db_path = db_path or DATABASE_PATH
+        self._write_version = 0
         ensure_directories()
+        if not Path(self.db_path).exists() and DATABASE_TEMPLATE_PATH.exists():
+            shutil.copyfile(DATABASE_TEMPLATE_PATH, self.db_path)
         self._init_database()
     
+    def write_version(self) -> int:
+        """Counter bumped after every committed write (cheap cache key)."""
+        return self._write_version
+    
     @contextmanager
     def _get_connection(self):
         """Context manager for database connections."""
@@ -39,17 +47,38 @@ class Database:
         try:
             yield conn
             conn.commit()
+            if conn.total_changes:
+                self._write_version += 1
         except Exception:
             conn.rollback()
             raise
         finally:
             conn.close()
     
+    def open_readonly(self) -> sqlite3.Connection:
+        """Open a read-only connection for query-heavy views.
+        
+        The caller owns the connection and should close it when done.
+        """
+        conn = sqlite3.connect(f"file:{Path(self.db_path).as_posix()}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        conn.executescript("""
+            PRAGMA query_only = 1;
+            PRAGMA mmap_size = 1073741824;  -- 1 GB (bounded by file size)
+            PRAGMA cache_size = -65536;     -- 64 MB page cache
+            PRAGMA temp_store = MEMORY;
+        """)
+        return conn
+    
     def _init_database(self):
         """Create database tables if they don't exist."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
+            # WAL lets long-lived readers (e.g. the Auditor) coexist with
+            # writers; the mode is persistent, so it only needs setting once
+            cursor.execute("PRAGMA journal_mode = WAL")
+            
             # Transactions table (the ledger)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS transactions (
@@ -187,6 +216,15 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_transactions_category 
                 ON transactions(category)
             """)
+            # Auditor ledger summary: latest row by type, and per-type totals
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_transactions_type_id 
+                ON transactions(type, id DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_transactions_type_total 
+                ON transactions(type, total)
+            """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_items_art_nr 
                 ON items(art_nr)
@@ -359,6 +359,8 @@ class SessionManager:
             bp.power_setups = []
             if hasattr(bp, '_refresh_equipment_table'):
                 bp._refresh_equipment_table()
+            if hasattr(bp, '_refresh_facility_display'):
+                bp._refresh_facility_display()
             if hasattr(bp, '_update_summary'):
                 bp._update_summary()
             
@@ -0,0 +1,67 @@
+"""
+Dashboard / Ledger consistency across New Session.
+
+Needs PyQt6; runs headless on the offscreen platform against a scratch database.
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PyQt6.QtWidgets import QApplication
+
+from config.settings import TAB_INDEX
+
+
+@pytest.fixture
+def main_window(tmp_path, monkeypatch):
+    """A MainWindow backed by a throwaway database, showing the Dashboard."""
+    import core.database as database
+
+    monkeypatch.chdir(tmp_path)  # SessionManager creates ./sessions
+    monkeypatch.setattr(database, "_db_instance", database.Database(tmp_path / "test.db"))
+
+    app = QApplication.instance() or QApplication([])
+
+    from ui.main_window import MainWindow
+    window = MainWindow()
+    window.show()
+    window.tab_widget.setCurrentIndex(TAB_INDEX["dashboard"])
+    app.processEvents()
+    yield window
+    window.close()
+
+
+def test_dashboard_refreshes_after_new_session(main_window):
+    from core.session_manager import SessionManager
+
+    ledger = main_window.ledger_tab
+    dashboard = main_window.dashboard_tab
+
+    ledger._add_transaction({
+        'date': '2021-04-23',
+        'type': 'Sale',
+        'item': 'Iron Ore',
+        'category': 'Resources - Ore',
+        'quantity': 10,
+        'unit_price': 100,
+        'subtotal': 1000,
+        'discount': 0,
+        'total': 1000,
+        'account': 'Personal',
+    })
+    dashboard._do_refresh()
+    assert dashboard.transactions_value.text() == "1"
+    assert dashboard.activity_model.rowCount() == 1
+
+    SessionManager(main_window).new_session()
+    dashboard._do_refresh()
+
+    assert ledger.table.rowCount() == 0
+    assert dashboard.transactions_value.text() == "0"
+    assert dashboard.activity_model.rowCount() == 0
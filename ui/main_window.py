@@ -7,11 +7,11 @@ from PyQt6.QtWidgets import (
     QTabWidget, 
     QWidget, 
     QVBoxLayout,
-    QLabel,
     QStatusBar,
+    QMessageBox,
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QAction
+from PyQt6.QtGui import QAction, QColor, QFont, QPainter, QStaticText, QTextOption
 
 from config.settings import (
     APP_NAME, 
@@ -20,10 +20,99 @@ from config.settings import (
     WINDOW_MIN_HEIGHT,
     WINDOW_DEFAULT_WIDTH,
     WINDOW_DEFAULT_HEIGHT,
-    TABS,
+    TAB_NAMES,
+    TAB_IDS,
+    TAB_INDEX,
 )
 
 
+# Static help/info dialog content
+_CHECK_UPDATES_HTML = (
+    f"<p>You are running {APP_NAME} v{APP_VERSION}</p>"
+    "<p>This is the latest version.</p>"
+    "<p>Check GitHub for updates:<br>"
+    "https://github.com/your-repo/frontier-mining-tracker</p>"
+)
+
+_QUICK_START_HTML = """
+<h2>🚀 Quick Start Guide</h2>
+
+<h3>Getting Started</h3>
+<p>1. <b>Dashboard</b> - Overview of your mining operations</p>
+<p>2. <b>Ledger</b> - Track all income and expenses</p>
+<p>3. <b>ROI Tracker</b> - Monitor investment returns</p>
+<p>4. <b>Inventory</b> - Track ore and resources</p>
+<p>5. <b>Budget Planner</b> - Plan equipment purchases</p>
+
+<h3>Key Shortcuts</h3>
+<p><b>Ctrl+N</b> - New Transaction</p>
+<p><b>Ctrl+S</b> - Save Session</p>
+<p><b>Ctrl+1-9</b> - Navigate to tabs</p>
+<p><b>F5</b> - Refresh Dashboard</p>
+
+<h3>Tips</h3>
+<p>• Save your session regularly (Ctrl+S)</p>
+<p>• Check the Dashboard for oil cap status</p>
+<p>• Use the Budget Planner before big purchases</p>
+"""
+
+_GAME_REFERENCE_HTML = """
+<h2>🎮 Out of Ore - Game Reference</h2>
+
+<h3>Hardcore Mode Starting Capital</h3>
+<p>• Personal: $10,000 (10%)</p>
+<p>• Company: $90,000 (90%)</p>
+<p>• Total: $100,000</p>
+
+<h3>Income Split (Ore/Oil Sales)</h3>
+<p>• Company receives: 90%</p>
+<p>• Personal receives: 10%</p>
+
+<h3>Skill Discounts</h3>
+<p>• Vendor Negotiation: 0.5% per level (max 7)</p>
+<p>• Investment Forecasting: 0.5% per level (max 6)</p>
+
+<h3>Bulk Pricing</h3>
+<p>• 2+ units sold together = bulk rate applies</p>
+<p>• Single units round up to nearest dollar</p>
+
+<h3>Challenge Mode Oil Cap</h3>
+<p>• Default lifetime cap: 10,000 units</p>
+<p>• Configure in Settings tab</p>
+"""
+
+
+class _PlaceholderWidget(QWidget):
+    """Lightweight "Coming Soon" tab that paints a cached QStaticText."""
+    
+    _static_texts = {}  # name -> QStaticText, shared by all placeholders
+    _color = QColor("#666")
+    
+    def __init__(self, name: str, parent=None):
+        super().__init__(parent)
+        self._font = QFont(self.font())
+        self._font.setPixelSize(24)
+        
+        text = self._static_texts.get(name)
+        if text is None:
+            text = QStaticText(f"{name}<br><br>(Coming Soon)")
+            text.setTextFormat(Qt.TextFormat.RichText)
+            text.setTextOption(QTextOption(Qt.AlignmentFlag.AlignHCenter))
+            text.prepare(font=self._font)
+            self._static_texts[name] = text
+        self._text = text
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setFont(self._font)
+        painter.setPen(self._color)
+        size = self._text.size()
+        x = (self.width() - size.width()) / 2
+        y = (self.height() - size.height()) / 2
+        painter.drawStaticText(int(x), int(y), self._text)
+        painter.end()
+
+
 class MainWindow(QMainWindow):
     """Main application window containing the tab widget."""
     
@@ -33,6 +122,9 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
         self.resize(WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT)
         
+        # Static info dialogs (Quick Start, Game Reference, ...) are built once and reused
+        self._info_dialogs = {}
+        
         # Initialize UI components
         self._setup_central_widget()
         self._setup_tabs()
@@ -69,7 +161,7 @@ class MainWindow(QMainWindow):
         from ui.tabs.production_tab import ProductionTab
         
         # Create tabs
-        for tab_name, tab_id in TABS:
+        for tab_name, tab_id in zip(TAB_NAMES, TAB_IDS):
             if tab_id == "dashboard":
                 tab = DashboardTab(self)
                 self.dashboard_tab = tab
@@ -113,6 +205,13 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'material_movement_tab') and hasattr(self, 'ledger_tab'):
             self.material_movement_tab.set_ledger_tab(self.ledger_tab)
         
+        # Dashboard follows the tabs it summarises (its refreshes are coalesced)
+        if hasattr(self, 'dashboard_tab'):
+            for name in ('ledger_tab', 'inventory_tab', 'roi_tracker_tab'):
+                source = getattr(self, name, None)
+                if source is not None:
+                    source.data_changed.connect(self.dashboard_tab.refresh_dashboard)
+        
         # Refresh ledger opening row now that settings_tab exists
         if hasattr(self, 'ledger_tab'):
             self.ledger_tab._populate_opening_row()
@@ -121,21 +220,7 @@ class MainWindow(QMainWindow):
     
     def _create_placeholder_tab(self, name: str) -> QWidget:
         """Create a placeholder tab widget (to be replaced later)."""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        label = QLabel(f"{name}\n\n(Coming Soon)")
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                color: #666;
-            }
-        """)
-        layout.addWidget(label)
-        
-        return widget
+        return _PlaceholderWidget(name)
     
     def _setup_menubar(self):
         """Create the application menu bar."""
@@ -280,8 +365,25 @@ class MainWindow(QMainWindow):
         refresh_action.triggered.connect(self._on_refresh_dashboard)
         view_menu.addAction(refresh_action)
         
-        # ========== TOOLS MENU ==========
+        # ========== TOOLS / HELP MENUS ==========
+        # These menus are populated on first show. Actions that carry a
+        # shortcut must exist up front, so F1 is registered on the window now.
         tools_menu = menubar.addMenu("&Tools")
+        tools_menu.aboutToShow.connect(lambda: self._populate_tools_menu(tools_menu))
+        
+        help_menu = menubar.addMenu("&Help")
+        help_menu.aboutToShow.connect(lambda: self._populate_help_menu(help_menu))
+        
+        self.quick_start_action = QAction("🚀 &Quick Start Guide", self)
+        self.quick_start_action.setShortcut("F1")
+        self.quick_start_action.triggered.connect(self._on_quick_start)
+        self.addAction(self.quick_start_action)
+    
+    def _populate_tools_menu(self, tools_menu):
+        """Fill the Tools menu the first time it is opened."""
+        if getattr(self, '_tools_menu_built', False):
+            return
+        self._tools_menu_built = True
         
         # Calculators submenu
         calc_menu = tools_menu.addMenu("🧮 &Calculators")
@@ -323,14 +425,14 @@ class MainWindow(QMainWindow):
         validate_action = QAction("✅ &Validate Data...", self)
         validate_action.triggered.connect(self._on_validate_data)
         tools_menu.addAction(validate_action)
+    
+    def _populate_help_menu(self, help_menu):
+        """Fill the Help menu the first time it is opened."""
+        if getattr(self, '_help_menu_built', False):
+            return
+        self._help_menu_built = True
         
-        # ========== HELP MENU ==========
-        help_menu = menubar.addMenu("&Help")
-        
-        quick_start_action = QAction("🚀 &Quick Start Guide", self)
-        quick_start_action.setShortcut("F1")
-        quick_start_action.triggered.connect(self._on_quick_start)
-        help_menu.addAction(quick_start_action)
+        help_menu.addAction(self.quick_start_action)
         
         shortcuts_action = QAction("⌨️ &Keyboard Shortcuts...", self)
         shortcuts_action.triggered.connect(self._on_keyboard_shortcuts)
@@ -365,20 +467,18 @@ class MainWindow(QMainWindow):
     def _on_new_transaction(self):
         """Handle new transaction action."""
         # Switch to Ledger tab
-        ledger_index = [tab_id for _, tab_id in TABS].index("ledger")
-        self.tab_widget.setCurrentIndex(ledger_index)
+        self.tab_widget.setCurrentIndex(TAB_INDEX["ledger"])
         self.status_bar.showMessage("New transaction - Ledger tab selected")
     
     def _on_audit_save(self):
         """Handle audit save file action."""
         # Switch to Auditor tab
-        auditor_index = [tab_id for _, tab_id in TABS].index("auditor")
-        self.tab_widget.setCurrentIndex(auditor_index)
+        self.tab_widget.setCurrentIndex(TAB_INDEX["auditor"])
         self.status_bar.showMessage("Auditor tab selected")
     
     def _on_about(self):
         """Show about dialog."""
-        from PyQt6.QtWidgets import QMessageBox
+        # QMessageBox.about keeps the app-icon/plain-text look; cheap to build
         QMessageBox.about(
             self,
             f"About {APP_NAME}",
@@ -387,6 +487,18 @@ class MainWindow(QMainWindow):
             "Track transactions, manage inventory, and audit save files."
         )
     
+    def _show_info(self, key: str, title: str, html: str):
+        """Show a static information dialog, building it only on first use."""
+        msg = self._info_dialogs.get(key)
+        if msg is None:
+            msg = QMessageBox(self)
+            msg.setWindowTitle(title)
+            msg.setTextFormat(Qt.TextFormat.RichText)
+            msg.setText(html)
+            msg.setIcon(QMessageBox.Icon.Information)
+            self._info_dialogs[key] = msg
+        msg.exec()
+    
     def _on_new_session(self):
         """Handle new session action."""
         from PyQt6.QtWidgets import QMessageBox
@@ -698,9 +810,8 @@ class MainWindow(QMainWindow):
     def _go_to_tab(self, tab_id: str):
         """Navigate to a specific tab by ID."""
         try:
-            tab_ids = [tid for _, tid in TABS]
-            if tab_id in tab_ids:
-                index = tab_ids.index(tab_id)
+            index = TAB_INDEX.get(tab_id)
+            if index is not None:
                 self.tab_widget.setCurrentIndex(index)
         except Exception as e:
             print(f"Error navigating to tab {tab_id}: {e}")
@@ -764,36 +875,7 @@ class MainWindow(QMainWindow):
     
     def _on_quick_start(self):
         """Show Quick Start Guide."""
-        from PyQt6.QtWidgets import QMessageBox
-        
-        guide = """
-<h2>🚀 Quick Start Guide</h2>
-
-<h3>Getting Started</h3>
-<p>1. <b>Dashboard</b> - Overview of your mining operations</p>
-<p>2. <b>Ledger</b> - Track all income and expenses</p>
-<p>3. <b>ROI Tracker</b> - Monitor investment returns</p>
-<p>4. <b>Inventory</b> - Track ore and resources</p>
-<p>5. <b>Budget Planner</b> - Plan equipment purchases</p>
-
-<h3>Key Shortcuts</h3>
-<p><b>Ctrl+N</b> - New Transaction</p>
-<p><b>Ctrl+S</b> - Save Session</p>
-<p><b>Ctrl+1-9</b> - Navigate to tabs</p>
-<p><b>F5</b> - Refresh Dashboard</p>
-
-<h3>Tips</h3>
-<p>• Save your session regularly (Ctrl+S)</p>
-<p>• Check the Dashboard for oil cap status</p>
-<p>• Use the Budget Planner before big purchases</p>
-"""
-        
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Quick Start Guide")
-        msg.setTextFormat(Qt.TextFormat.RichText)
-        msg.setText(guide)
-        msg.setIcon(QMessageBox.Icon.Information)
-        msg.exec()
+        self._show_info("quick_start", "Quick Start Guide", _QUICK_START_HTML)
     
     def _on_keyboard_shortcuts(self):
         """Show keyboard shortcuts dialog."""
@@ -849,49 +931,8 @@ class MainWindow(QMainWindow):
     
     def _on_game_reference(self):
         """Show game reference information."""
-        from PyQt6.QtWidgets import QMessageBox
-        
-        reference = """
-<h2>🎮 Out of Ore - Game Reference</h2>
-
-<h3>Hardcore Mode Starting Capital</h3>
-<p>• Personal: $10,000 (10%)</p>
-<p>• Company: $90,000 (90%)</p>
-<p>• Total: $100,000</p>
-
-<h3>Income Split (Ore/Oil Sales)</h3>
-<p>• Company receives: 90%</p>
-<p>• Personal receives: 10%</p>
-
-<h3>Skill Discounts</h3>
-<p>• Vendor Negotiation: 0.5% per level (max 7)</p>
-<p>• Investment Forecasting: 0.5% per level (max 6)</p>
-
-<h3>Bulk Pricing</h3>
-<p>• 2+ units sold together = bulk rate applies</p>
-<p>• Single units round up to nearest dollar</p>
-
-<h3>Challenge Mode Oil Cap</h3>
-<p>• Default lifetime cap: 10,000 units</p>
-<p>• Configure in Settings tab</p>
-"""
-        
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Game Reference")
-        msg.setTextFormat(Qt.TextFormat.RichText)
-        msg.setText(reference)
-        msg.setIcon(QMessageBox.Icon.Information)
-        msg.exec()
+        self._show_info("game_reference", "Game Reference", _GAME_REFERENCE_HTML)
     
     def _on_check_updates(self):
         """Check for updates (placeholder)."""
-        from PyQt6.QtWidgets import QMessageBox
-        
-        QMessageBox.information(
-            self,
-            "Check for Updates",
-            f"You are running {APP_NAME} v{APP_VERSION}\n\n"
-            "This is the latest version.\n\n"
-            "Check GitHub for updates:\n"
-            "https://github.com/your-repo/frontier-mining-tracker"
-        )
+        self._show_info("check_updates", "Check for Updates", _CHECK_UPDATES_HTML)
@@ -2,41 +2,46 @@
 UI Tabs Module
 
 Contains all tab widgets for the main application.
+
+Tab classes are resolved lazily (PEP 562) so that importing one tab does not
+pull in every other tab module.
 """
 
-from ui.tabs.dashboard_tab import DashboardTab
-from ui.tabs.reference_tab import ReferenceDataTab, ItemsSubTab
-from ui.tabs.ledger_tab import LedgerTab
-from ui.tabs.auditor_tab import AuditorTab
-from ui.tabs.locations_tab import LocationsTab  # Legacy - kept for backwards compatibility
-from ui.tabs.factory_subtab import FactoryEquipmentSubTab
-from ui.tabs.vehicles_subtab import VehiclesSubTab
-from ui.tabs.buildings_subtab import BuildingsSubTab
-from ui.tabs.recipes_subtab import RecipesSubTab
-from ui.tabs.locations_subtab import LocationsSubTab
-from ui.tabs.material_movement_tab import MaterialMovementTab
-from ui.tabs.inventory_tab import InventoryTab
-from ui.tabs.settings_tab import SettingsTab
-from ui.tabs.budget_planner_tab import BudgetPlannerTab
-from ui.tabs.roi_tracker_tab import ROITrackerTab
-from ui.tabs.production_tab import ProductionTab
-
-__all__ = [
-    "DashboardTab",
-    "ReferenceDataTab",
-    "ItemsSubTab",
-    "LedgerTab",
-    "AuditorTab",
-    "LocationsTab",  # Legacy
-    "LocationsSubTab",
-    "FactoryEquipmentSubTab",
-    "VehiclesSubTab",
-    "BuildingsSubTab",
-    "RecipesSubTab",
-    "MaterialMovementTab",
-    "InventoryTab",
-    "SettingsTab",
-    "BudgetPlannerTab",
-    "ROITrackerTab",
-    "ProductionTab",
-]
+import importlib
+
+# Public name -> defining submodule (single source of truth for __all__)
+_LAZY = {
+    "DashboardTab": "ui.tabs.dashboard_tab",
+    "ReferenceDataTab": "ui.tabs.reference_tab",
+    "ItemsSubTab": "ui.tabs.reference_tab",
+    "LedgerTab": "ui.tabs.ledger_tab",
+    "AuditorTab": "ui.tabs.auditor_tab",
+    "LocationsTab": "ui.tabs.locations_tab",  # Legacy - kept for backwards compatibility
+    "LocationsSubTab": "ui.tabs.locations_subtab",
+    "FactoryEquipmentSubTab": "ui.tabs.factory_subtab",
+    "VehiclesSubTab": "ui.tabs.vehicles_subtab",
+    "BuildingsSubTab": "ui.tabs.buildings_subtab",
+    "RecipesSubTab": "ui.tabs.recipes_subtab",
+    "MaterialMovementTab": "ui.tabs.material_movement_tab",
+    "InventoryTab": "ui.tabs.inventory_tab",
+    "SettingsTab": "ui.tabs.settings_tab",
+    "BudgetPlannerTab": "ui.tabs.budget_planner_tab",
+    "ROITrackerTab": "ui.tabs.roi_tracker_tab",
+    "ProductionTab": "ui.tabs.production_tab",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Import a tab class from its submodule on first access."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(importlib.import_module(module_name), name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
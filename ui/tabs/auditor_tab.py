@@ -19,6 +19,7 @@ from PyQt6.QtWidgets import (
     QFileDialog,
     QTableWidget,
     QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QMessageBox,
     QTextEdit,
@@ -26,16 +27,33 @@ from PyQt6.QtWidgets import (
     QAbstractItemView,
     QFrame,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QUrl,
+)
+from PyQt6.QtGui import QColor, QDesktopServices, QFont
 
+from contextlib import closing
 from pathlib import Path
 from typing import Optional
+import mmap
 import os
+import re
 import xml.etree.ElementTree as ET
 
+try:
+    from lxml import etree as _lxml_etree  # Optional: faster C parser
+except ImportError:
+    _lxml_etree = None
+
 from core.database import Database, get_database
-from auditor.save_parser import SaveFileParser, SaveFileData, parse_save_file
+from auditor.save_parser import SaveFileParser, SaveFileData, SaveTransaction, parse_save_file
 
 
 # Skill Row Mapping from XML
@@ -54,9 +72,43 @@ SKILL_ROWS = {
 VN_ROW = 8
 IF_ROW = 4
 
+# Info panel label styles (applied once at creation)
+_FIELD_LABEL_STYLE = "font-weight: bold;"
+_VALUE_LABEL_STYLE = "color: #333;"
+
+# Shared colors/alignment for table cells
+_COLOR_NEG = QColor(0xc6, 0x28, 0x28)  # #c62828
+_COLOR_POS = QColor(0x2e, 0x7d, 0x32)  # #2e7d32
+_ALIGN_RIGHT_V = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+# Audit log level -> text color
+_LOG_COLORS = {
+    "INFO": "#333",
+    "SUCCESS": "#2e7d32",
+    "WARNING": "#f57c00",
+    "ERROR": "#c62828",
+}
+
+# Pre-bound formatters for the info panels
+_MONEY_FMT = "${:,.0f}".format
+_SIGNED_MONEY_FMT = "${:+,.0f}".format
+_LEVEL_FMT = "Level {}".format
+_PERCENT_FMT = "{:.1f}%".format
+_COUNT_FMT = "{:,}".format
+_BYTES_FMT = "{:,} bytes".format
+
 
 class CompanyXMLData:
-    """Parsed data from company XML file."""
+    """Parsed data from company XML file.
+    
+    Discount percentages are computed once by parse_company_xml().
+    """
+    
+    __slots__ = (
+        "company_name", "company_money", "company_debt", "company_experience",
+        "skill_points", "interest_rate", "fuel_price", "skills",
+        "vn_level", "if_level", "vn_discount", "if_discount", "total_vehicle_discount",
+    )
     
     def __init__(self):
         self.company_name: str = ""
@@ -69,35 +121,30 @@ class CompanyXMLData:
         self.skills: dict = {}  # row_id -> level
         self.vn_level: int = 0
         self.if_level: int = 0
-    
-    @property
-    def vn_discount(self) -> float:
-        """Calculate VN discount percentage."""
-        return self.vn_level * 0.5
-    
-    @property
-    def if_discount(self) -> float:
-        """Calculate IF discount percentage."""
-        return self.if_level * 0.5
-    
-    @property
-    def total_vehicle_discount(self) -> float:
-        """Calculate total vehicle discount (VN + IF)."""
-        return self.vn_discount + self.if_discount
+        self.vn_discount: float = 0.0             # VN discount percentage
+        self.if_discount: float = 0.0             # IF discount percentage
+        self.total_vehicle_discount: float = 0.0  # VN + IF
+
+
+# An '&' that does not start a valid entity or character reference
+_BARE_AMPERSAND_RE = re.compile(rb'&(?!(?:amp|lt|gt|quot|apos|#[0-9]+|#x[0-9a-fA-F]+);)')
 
 
 def parse_company_xml(file_path: Path) -> CompanyXMLData:
     """Parse company XML file and extract data."""
     data = CompanyXMLData()
     
-    # Read and fix unescaped ampersands
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Fix common XML issues (unescaped &)
-    content = content.replace('&', '&amp;').replace('&amp;amp;', '&amp;')
+    # Map the file and escape bare ampersands in a single pass over the
+    # mapped bytes, so the only copy made is the buffer handed to the parser
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = _BARE_AMPERSAND_RE.sub(b'&amp;', mm)
     
-    root = ET.fromstring(content)
+    if _lxml_etree is not None:
+        parser = _lxml_etree.XMLParser(recover=True, huge_tree=False)
+        root = _lxml_etree.fromstring(content, parser=parser)
+    else:
+        root = ET.fromstring(content)
     
     # Basic company info
     data.company_name = root.find('companyName').text or ""
@@ -111,21 +158,102 @@ def parse_company_xml(file_path: Path) -> CompanyXMLData:
     # Parse unlocked skills
     unlocked_skills = root.find('unlockedSkills')
     if unlocked_skills is not None:
-        for entry in unlocked_skills.findall('entry'):
-            row = int(entry.get('rowName', 0))
-            stage = int(entry.get('stage', 0))
-            level = stage + 1  # Level = Stage + 1
-            data.skills[row] = level
-            
-            # Extract VN and IF specifically
-            if row == VN_ROW:
-                data.vn_level = level
-            elif row == IF_ROW:
-                data.if_level = level
+        skills = data.skills
+        for entry in unlocked_skills.iterfind('entry'):
+            attrib = entry.attrib
+            # Level = Stage + 1
+            skills[int(attrib.get('rowName', 0))] = int(attrib.get('stage', 0)) + 1
+        
+        # Extract VN and IF specifically
+        data.vn_level = skills.get(VN_ROW, 0)
+        data.if_level = skills.get(IF_ROW, 0)
+    
+    # Discounts: 0.5% per level
+    data.vn_discount = data.vn_level * 0.5
+    data.if_discount = data.if_level * 0.5
+    data.total_vehicle_discount = data.vn_discount + data.if_discount
     
     return data
 
 
+class _ParseSignals(QObject):
+    """Signals emitted by ParseWorker (QRunnable cannot emit signals itself)."""
+    finished = pyqtSignal(object, object)  # file_path, parsed data
+    failed = pyqtSignal(object, str)       # file_path, error message
+
+
+class ParseWorker(QRunnable):
+    """Runs a file parser off the GUI thread."""
+    
+    def __init__(self, parse_func, file_path: Path):
+        super().__init__()
+        self.parse_func = parse_func
+        self.file_path = file_path
+        self.signals = _ParseSignals()
+    
+    def run(self):
+        try:
+            result = self.parse_func(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, str(e))
+            return
+        self.signals.finished.emit(self.file_path, result)
+
+
+class SaveTransactionsModel(QAbstractTableModel):
+    """Read-only table model over the transactions parsed from a save file.
+    
+    Holds the parsed list by reference; Qt only asks for visible cells.
+    """
+    
+    HEADERS = ["Code", "Category", "Amount", "Type"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._transactions: list[SaveTransaction] = []
+    
+    def set_transactions(self, transactions: list[SaveTransaction]):
+        """Replace the backing transaction list."""
+        self.beginResetModel()
+        self._transactions = transactions
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._transactions)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        txn = self._transactions[index.row()]
+        col = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return txn.item_code
+            if col == 1:
+                return txn.category
+            if col == 2:
+                return _MONEY_FMT(txn.amount)
+            return "Purchase" if txn.is_purchase else "Sale"
+        
+        if col == 2:
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return _ALIGN_RIGHT_V
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return _COLOR_NEG if txn.amount_raw < 0 else _COLOR_POS
+        
+        return None
+
+
 class AuditorTab(QWidget):
     """Auditor tab for save file verification."""
     
@@ -135,6 +263,14 @@ class AuditorTab(QWidget):
         self.save_data: Optional[SaveFileData] = None
         self.xml_data: Optional[CompanyXMLData] = None
         
+        # DB lookups cached as (db write version, value)
+        self._summary_cache: Optional[tuple[int, dict]] = None
+        self._game_info_cache: dict[str, tuple[int, Optional[int]]] = {}
+        
+        # Path of the in-flight background parse (see _start_parse)
+        self._pending_save_path: Optional[Path] = None
+        self._pending_xml_path: Optional[Path] = None
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -234,11 +370,11 @@ class AuditorTab(QWidget):
             row = QHBoxLayout()
             label = QLabel(label_text)
             label.setFixedWidth(120)
-            label.setStyleSheet("font-weight: bold;")
+            label.setStyleSheet(_FIELD_LABEL_STYLE)
             row.addWidget(label)
             
             value_label = QLabel("-")
-            value_label.setStyleSheet("color: #333;")
+            value_label.setStyleSheet(_VALUE_LABEL_STYLE)
             self.sav_info_labels[key] = value_label
             row.addWidget(value_label, stretch=1)
             
@@ -269,11 +405,11 @@ class AuditorTab(QWidget):
             row = QHBoxLayout()
             label = QLabel(label_text)
             label.setFixedWidth(120)
-            label.setStyleSheet("font-weight: bold;")
+            label.setStyleSheet(_FIELD_LABEL_STYLE)
             row.addWidget(label)
             
             value_label = QLabel("-")
-            value_label.setStyleSheet("color: #333;")
+            value_label.setStyleSheet(_VALUE_LABEL_STYLE)
             self.xml_info_labels[key] = value_label
             row.addWidget(value_label, stretch=1)
             
@@ -283,9 +419,9 @@ class AuditorTab(QWidget):
         
         # Transaction list from save
         layout.addWidget(QLabel("Save File Transactions:"))
-        self.save_transactions_table = QTableWidget()
-        self.save_transactions_table.setColumnCount(4)
-        self.save_transactions_table.setHorizontalHeaderLabels(["Code", "Category", "Amount", "Type"])
+        self.save_transactions_model = SaveTransactionsModel()
+        self.save_transactions_table = QTableView()
+        self.save_transactions_table.setModel(self.save_transactions_model)
         self.save_transactions_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.save_transactions_table.setMaximumHeight(150)
         layout.addWidget(self.save_transactions_table)
@@ -351,12 +487,7 @@ class AuditorTab(QWidget):
         from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
         
-        color = {
-            "INFO": "#333",
-            "SUCCESS": "#2e7d32",
-            "WARNING": "#f57c00",
-            "ERROR": "#c62828",
-        }.get(level, "#333")
+        color = _LOG_COLORS.get(level, "#333")
         
         self.audit_log.append(f'<span style="color: #999;">[{timestamp}]</span> '
                              f'<span style="color: {color};">{message}</span>')
@@ -393,6 +524,7 @@ class AuditorTab(QWidget):
     def _on_clear_xml(self):
         """Clear the loaded XML file."""
         self.xml_data = None
+        self._pending_xml_path = None
         self.xml_path_label.setText("No XML file loaded")
         self.xml_path_label.setStyleSheet("color: #666; font-style: italic;")
         self.clear_xml_btn.setEnabled(False)
@@ -404,15 +536,8 @@ class AuditorTab(QWidget):
         folder = self._get_game_saves_folder()
         
         if folder.exists():
-            import subprocess
-            import sys
-            
-            if sys.platform == 'win32':
-                subprocess.run(['explorer', str(folder)])
-            elif sys.platform == 'darwin':
-                subprocess.run(['open', str(folder)])
-            else:
-                subprocess.run(['xdg-open', str(folder)])
+            # Hands off to the platform file manager without blocking
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(folder)))
             
             self._log(f"Opened folder: {folder}")
         else:
@@ -446,78 +571,119 @@ class AuditorTab(QWidget):
             pass
     
     def _load_save_file(self, file_path: Path):
-        """Load and parse a save file."""
+        """Parse a save file on the thread pool; results land in _on_save_parsed."""
         self._log(f"Loading save file: {file_path.name}")
+        self._pending_save_path = file_path
+        self._start_parse(parse_save_file, file_path, self._on_save_parsed, self._on_save_parse_failed)
+    
+    def _on_save_parsed(self, file_path: Path, save_data: SaveFileData):
+        """Apply a parsed save file to the UI (GUI thread)."""
+        if file_path != self._pending_save_path:
+            return  # A newer load superseded this one
+        self._pending_save_path = None
+        
+        self.save_data = save_data
+        self._update_sav_info()
+        self._populate_save_transactions()
+        
+        self.sav_path_label.setText(str(file_path))
+        self.sav_path_label.setStyleSheet("color: #333;")
+        self.reload_btn.setEnabled(True)
+        self.compare_btn.setEnabled(True)
+        
+        self.status_label.setText("✅ Save file loaded - Ready for verification")
+        self.status_label.setStyleSheet("font-size: 14px; padding: 10px; color: #2e7d32;")
+        
+        self._log(f"Successfully loaded save file", "SUCCESS")
+        self._log(f"  Personal Money: ${self.save_data.current_money:,.0f}")
+        self._log(f"  Transactions: {len(self.save_data.transactions)}")
+    
+    def _on_save_parse_failed(self, file_path: Path, error: str):
+        """Report a save file parse error (GUI thread)."""
+        if file_path != self._pending_save_path:
+            return
+        self._pending_save_path = None
         
-        try:
-            self.save_data = parse_save_file(file_path)
-            self._update_sav_info()
-            self._populate_save_transactions()
-            
-            self.sav_path_label.setText(str(file_path))
-            self.sav_path_label.setStyleSheet("color: #333;")
-            self.reload_btn.setEnabled(True)
-            self.compare_btn.setEnabled(True)
-            
-            self.status_label.setText("✅ Save file loaded - Ready for verification")
-            self.status_label.setStyleSheet("font-size: 14px; padding: 10px; color: #2e7d32;")
-            
-            self._log(f"Successfully loaded save file", "SUCCESS")
-            self._log(f"  Personal Money: ${self.save_data.current_money:,.0f}")
-            self._log(f"  Transactions: {len(self.save_data.transactions)}")
-            
-        except Exception as e:
-            self._log(f"Error loading save file: {e}", "ERROR")
-            QMessageBox.critical(self, "Error", f"Failed to load save file:\n{e}")
+        self._log(f"Error loading save file: {error}", "ERROR")
+        QMessageBox.critical(self, "Error", f"Failed to load save file:\n{error}")
     
     def _load_xml_file(self, file_path: Path):
-        """Load and parse a company XML file."""
+        """Parse a company XML file on the thread pool; results land in _on_xml_parsed."""
         self._log(f"Loading XML file: {file_path.name}")
+        self._pending_xml_path = file_path
+        self._start_parse(parse_company_xml, file_path, self._on_xml_parsed, self._on_xml_parse_failed)
+    
+    def _on_xml_parsed(self, file_path: Path, xml_data: CompanyXMLData):
+        """Apply a parsed company XML file to the UI (GUI thread)."""
+        if file_path != self._pending_xml_path:
+            return  # A newer load (or a clear) superseded this one
+        self._pending_xml_path = None
+        
+        self.xml_data = xml_data
+        self._update_xml_info()
+        
+        self.xml_path_label.setText(str(file_path))
+        self.xml_path_label.setStyleSheet("color: #333;")
+        self.clear_xml_btn.setEnabled(True)
+        
+        self._log(f"Successfully loaded XML file", "SUCCESS")
+        self._log(f"  Company: {self.xml_data.company_name}")
+        self._log(f"  Company Funds: ${self.xml_data.company_money:,}")
+        self._log(f"  VN Level: {self.xml_data.vn_level} ({self.xml_data.vn_discount}%)")
+        self._log(f"  IF Level: {self.xml_data.if_level} ({self.xml_data.if_discount}%)")
+    
+    def _on_xml_parse_failed(self, file_path: Path, error: str):
+        """Report a company XML parse error (GUI thread)."""
+        if file_path != self._pending_xml_path:
+            return
+        self._pending_xml_path = None
         
-        try:
-            self.xml_data = parse_company_xml(file_path)
-            self._update_xml_info()
-            
-            self.xml_path_label.setText(str(file_path))
-            self.xml_path_label.setStyleSheet("color: #333;")
-            self.clear_xml_btn.setEnabled(True)
-            
-            self._log(f"Successfully loaded XML file", "SUCCESS")
-            self._log(f"  Company: {self.xml_data.company_name}")
-            self._log(f"  Company Funds: ${self.xml_data.company_money:,}")
-            self._log(f"  VN Level: {self.xml_data.vn_level} ({self.xml_data.vn_discount}%)")
-            self._log(f"  IF Level: {self.xml_data.if_level} ({self.xml_data.if_discount}%)")
-            
-        except Exception as e:
-            self._log(f"Error loading XML file: {e}", "ERROR")
-            QMessageBox.critical(self, "Error", f"Failed to load XML file:\n{e}")
+        self._log(f"Error loading XML file: {error}", "ERROR")
+        QMessageBox.critical(self, "Error", f"Failed to load XML file:\n{error}")
+    
+    def _start_parse(self, parse_func, file_path: Path, on_finished, on_failed):
+        """Run parse_func(file_path) on the global thread pool."""
+        worker = ParseWorker(parse_func, file_path)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(on_failed)
+        QThreadPool.globalInstance().start(worker)
     
     def _update_sav_info(self):
         """Update the save file info labels."""
         if not self.save_data:
             return
         
-        self.sav_info_labels["file_name"].setText(self.save_data.file_path.name)
-        self.sav_info_labels["file_size"].setText(f"{self.save_data.file_size:,} bytes")
-        self.sav_info_labels["map_name"].setText(self.save_data.map_name or "Unknown")
-        self.sav_info_labels["current_money"].setText(f"${self.save_data.current_money:,.0f}")
-        self.sav_info_labels["total_transactions"].setText(str(len(self.save_data.transactions)))
-        self.sav_info_labels["total_sales"].setText(f"${self.save_data.total_sales:,.0f}")
-        self.sav_info_labels["total_purchases"].setText(f"${abs(self.save_data.total_purchases):,.0f}")
+        save_data = self.save_data
+        labels = self.sav_info_labels
+        
+        self.setUpdatesEnabled(False)
+        labels["file_name"].setText(save_data.file_path.name)
+        labels["file_size"].setText(_BYTES_FMT(save_data.file_size))
+        labels["map_name"].setText(save_data.map_name or "Unknown")
+        labels["current_money"].setText(_MONEY_FMT(save_data.current_money))
+        labels["total_transactions"].setText(str(len(save_data.transactions)))
+        labels["total_sales"].setText(_MONEY_FMT(save_data.total_sales))
+        labels["total_purchases"].setText(_MONEY_FMT(abs(save_data.total_purchases)))
+        self.setUpdatesEnabled(True)
     
     def _update_xml_info(self):
         """Update the XML file info labels."""
         if not self.xml_data:
             return
         
-        self.xml_info_labels["company_name"].setText(self.xml_data.company_name or "Unknown")
-        self.xml_info_labels["company_money"].setText(f"${self.xml_data.company_money:,}")
-        self.xml_info_labels["vn_level"].setText(f"{self.xml_data.vn_level} / 7")
-        self.xml_info_labels["if_level"].setText(f"{self.xml_data.if_level} / 6")
-        self.xml_info_labels["vn_discount"].setText(f"{self.xml_data.vn_discount:.1f}%")
-        self.xml_info_labels["if_discount"].setText(f"{self.xml_data.if_discount:.1f}%")
-        self.xml_info_labels["total_vehicle_discount"].setText(f"{self.xml_data.total_vehicle_discount:.1f}%")
-        self.xml_info_labels["skill_points"].setText(f"{self.xml_data.skill_points:,}")
+        xml_data = self.xml_data
+        labels = self.xml_info_labels
+        
+        self.setUpdatesEnabled(False)
+        labels["company_name"].setText(xml_data.company_name or "Unknown")
+        labels["company_money"].setText(_MONEY_FMT(xml_data.company_money))
+        labels["vn_level"].setText(f"{xml_data.vn_level} / 7")
+        labels["if_level"].setText(f"{xml_data.if_level} / 6")
+        labels["vn_discount"].setText(_PERCENT_FMT(xml_data.vn_discount))
+        labels["if_discount"].setText(_PERCENT_FMT(xml_data.if_discount))
+        labels["total_vehicle_discount"].setText(_PERCENT_FMT(xml_data.total_vehicle_discount))
+        labels["skill_points"].setText(_COUNT_FMT(xml_data.skill_points))
+        self.setUpdatesEnabled(True)
     
     def _clear_xml_info(self):
         """Clear the XML info labels."""
@@ -529,30 +695,7 @@ class AuditorTab(QWidget):
         if not self.save_data:
             return
         
-        transactions = self.save_data.transactions
-        self.save_transactions_table.setRowCount(len(transactions))
-        
-        for row, txn in enumerate(transactions):
-            # Code
-            code_item = QTableWidgetItem(txn.item_code)
-            self.save_transactions_table.setItem(row, 0, code_item)
-            
-            # Category
-            cat_item = QTableWidgetItem(txn.category)
-            self.save_transactions_table.setItem(row, 1, cat_item)
-            
-            # Amount
-            amount_item = QTableWidgetItem(f"${txn.amount:,.0f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            if txn.amount < 0:
-                amount_item.setForeground(QColor("#c62828"))
-            else:
-                amount_item.setForeground(QColor("#2e7d32"))
-            self.save_transactions_table.setItem(row, 2, amount_item)
-            
-            # Type
-            type_item = QTableWidgetItem("Purchase" if txn.is_purchase else "Sale")
-            self.save_transactions_table.setItem(row, 3, type_item)
+        self.save_transactions_model.set_transactions(self.save_data.transactions)
     
     def _on_run_comparison(self):
         """Run comparison between save file and ledger."""
@@ -562,7 +705,13 @@ class AuditorTab(QWidget):
         self._log("Starting verification...", "INFO")
         self.discrepancies_table.setRowCount(0)
         
-        discrepancies = []
+        # Formatters bound to locals; only called for reported discrepancies
+        fmt_money = _MONEY_FMT
+        fmt_signed_money = _SIGNED_MONEY_FMT
+        fmt_level = _LEVEL_FMT
+        
+        # (field, ledger value, save value, difference) rows
+        discrepancies: list[tuple[str, str, str, str]] = []
         
         # Get ledger data
         ledger_data = self._get_ledger_summary()
@@ -571,48 +720,52 @@ class AuditorTab(QWidget):
         save_money = self.save_data.current_money
         ledger_money = ledger_data.get('current_personal_balance', 0)
         
-        if abs(save_money - ledger_money) > 1:  # Allow $1 rounding tolerance
-            discrepancies.append({
-                'field': 'Personal Money',
-                'ledger': f"${ledger_money:,.0f}",
-                'save': f"${save_money:,.0f}",
-                'diff': f"${save_money - ledger_money:+,.0f}"
-            })
+        diff = save_money - ledger_money
+        if abs(diff) > 1:  # Allow $1 rounding tolerance
+            discrepancies.append((
+                'Personal Money',
+                fmt_money(ledger_money),
+                fmt_money(save_money),
+                fmt_signed_money(diff),
+            ))
         
         # Compare transaction counts
         save_txn_count = len(self.save_data.transactions)
         ledger_txn_count = ledger_data.get('transaction_count', 0)
         
-        if save_txn_count != ledger_txn_count:
-            discrepancies.append({
-                'field': 'Transaction Count',
-                'ledger': str(ledger_txn_count),
-                'save': str(save_txn_count),
-                'diff': f"{save_txn_count - ledger_txn_count:+d}"
-            })
+        diff = save_txn_count - ledger_txn_count
+        if diff:
+            discrepancies.append((
+                'Transaction Count',
+                str(ledger_txn_count),
+                str(save_txn_count),
+                f"{diff:+d}",
+            ))
         
         # Compare totals
         save_total_sales = self.save_data.total_sales
         ledger_total_sales = ledger_data.get('total_sales', 0)
         
-        if abs(save_total_sales - ledger_total_sales) > 1:
-            discrepancies.append({
-                'field': 'Total Sales',
-                'ledger': f"${ledger_total_sales:,.0f}",
-                'save': f"${save_total_sales:,.0f}",
-                'diff': f"${save_total_sales - ledger_total_sales:+,.0f}"
-            })
+        diff = save_total_sales - ledger_total_sales
+        if abs(diff) > 1:
+            discrepancies.append((
+                'Total Sales',
+                fmt_money(ledger_total_sales),
+                fmt_money(save_total_sales),
+                fmt_signed_money(diff),
+            ))
         
         save_total_purchases = abs(self.save_data.total_purchases)
         ledger_total_purchases = ledger_data.get('total_purchases', 0)
         
-        if abs(save_total_purchases - ledger_total_purchases) > 1:
-            discrepancies.append({
-                'field': 'Total Purchases',
-                'ledger': f"${ledger_total_purchases:,.0f}",
-                'save': f"${save_total_purchases:,.0f}",
-                'diff': f"${save_total_purchases - ledger_total_purchases:+,.0f}"
-            })
+        diff = save_total_purchases - ledger_total_purchases
+        if abs(diff) > 1:
+            discrepancies.append((
+                'Total Purchases',
+                fmt_money(ledger_total_purchases),
+                fmt_money(save_total_purchases),
+                fmt_signed_money(diff),
+            ))
         
         # If XML is loaded, compare company funds and skill settings
         if self.xml_data:
@@ -620,45 +773,51 @@ class AuditorTab(QWidget):
             xml_company_money = self.xml_data.company_money
             ledger_company_balance = ledger_data.get('current_company_balance', 0)
             
-            if abs(xml_company_money - ledger_company_balance) > 1:
-                discrepancies.append({
-                    'field': 'Company Funds',
-                    'ledger': f"${ledger_company_balance:,.0f}",
-                    'save': f"${xml_company_money:,}",
-                    'diff': f"${xml_company_money - ledger_company_balance:+,.0f}"
-                })
+            diff = xml_company_money - ledger_company_balance
+            if abs(diff) > 1:
+                discrepancies.append((
+                    'Company Funds',
+                    fmt_money(ledger_company_balance),
+                    fmt_money(xml_company_money),
+                    fmt_signed_money(diff),
+                ))
             
             # Compare VN Level with app settings
             app_vn_level = self._get_app_vn_level()
             if app_vn_level is not None and app_vn_level != self.xml_data.vn_level:
-                discrepancies.append({
-                    'field': 'VN Level',
-                    'ledger': f"Level {app_vn_level}",
-                    'save': f"Level {self.xml_data.vn_level}",
-                    'diff': f"{self.xml_data.vn_level - app_vn_level:+d}"
-                })
+                discrepancies.append((
+                    'VN Level',
+                    fmt_level(app_vn_level),
+                    fmt_level(self.xml_data.vn_level),
+                    f"{self.xml_data.vn_level - app_vn_level:+d}",
+                ))
             
             # Compare IF Level with app settings
             app_if_level = self._get_app_if_level()
             if app_if_level is not None and app_if_level != self.xml_data.if_level:
-                discrepancies.append({
-                    'field': 'IF Level',
-                    'ledger': f"Level {app_if_level}",
-                    'save': f"Level {self.xml_data.if_level}",
-                    'diff': f"{self.xml_data.if_level - app_if_level:+d}"
-                })
-        
-        # Populate discrepancies table
-        self.discrepancies_table.setRowCount(len(discrepancies))
-        
-        for row, disc in enumerate(discrepancies):
-            self.discrepancies_table.setItem(row, 0, QTableWidgetItem(disc['field']))
-            self.discrepancies_table.setItem(row, 1, QTableWidgetItem(disc['ledger']))
-            self.discrepancies_table.setItem(row, 2, QTableWidgetItem(disc['save']))
+                discrepancies.append((
+                    'IF Level',
+                    fmt_level(app_if_level),
+                    fmt_level(self.xml_data.if_level),
+                    f"{self.xml_data.if_level - app_if_level:+d}",
+                ))
+        
+        # Populate discrepancies table in one batch
+        table = self.discrepancies_table
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.setRowCount(len(discrepancies))
+        
+        for row, (field, ledger_value, save_value, diff) in enumerate(discrepancies):
+            table.setItem(row, 0, QTableWidgetItem(field))
+            table.setItem(row, 1, QTableWidgetItem(ledger_value))
+            table.setItem(row, 2, QTableWidgetItem(save_value))
             
-            diff_item = QTableWidgetItem(disc['diff'])
-            diff_item.setForeground(QColor("#c62828"))  # Red for discrepancy
-            self.discrepancies_table.setItem(row, 3, diff_item)
+            diff_item = QTableWidgetItem(diff)
+            diff_item.setForeground(_COLOR_NEG)  # Red for discrepancy
+            table.setItem(row, 3, diff_item)
+        
+        table.setUpdatesEnabled(True)
         
         # Update status
         if discrepancies:
@@ -672,32 +831,38 @@ class AuditorTab(QWidget):
     
     def _get_app_vn_level(self) -> Optional[int]:
         """Get the VN level configured in the app (from game_info table)."""
-        try:
-            with self.db._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT value FROM game_info WHERE key = 'vn_level'")
-                row = cursor.fetchone()
-                if row:
-                    return int(row[0])
-        except Exception:
-            pass
-        return None
+        return self._get_game_info_level('vn_level')
     
     def _get_app_if_level(self) -> Optional[int]:
         """Get the IF level configured in the app (from game_info table)."""
+        return self._get_game_info_level('if_level')
+    
+    def _get_game_info_level(self, key: str) -> Optional[int]:
+        """Read an integer from game_info, cached until the next DB write."""
+        version = self.db.write_version()
+        cached = self._game_info_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        level = None
         try:
-            with self.db._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT value FROM game_info WHERE key = 'if_level'")
+            with closing(self.db.open_readonly()) as conn, closing(conn.cursor()) as cursor:
+                cursor.execute("SELECT value FROM game_info WHERE key = ?", (key,))
                 row = cursor.fetchone()
                 if row:
-                    return int(row[0])
+                    level = int(row[0])
         except Exception:
             pass
-        return None
+        
+        self._game_info_cache[key] = (version, level)
+        return level
     
     def _get_ledger_summary(self) -> dict:
-        """Get summary data from the ledger."""
+        """Get summary data from the ledger (cached until the next DB write)."""
+        version = self.db.write_version()
+        if self._summary_cache is not None and self._summary_cache[0] == version:
+            return self._summary_cache[1]
+        
         summary = {
             'current_personal_balance': 0,
             'current_company_balance': 0,
@@ -706,40 +871,26 @@ class AuditorTab(QWidget):
             'total_purchases': 0,
         }
         
-        with self.db._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Get the most recent balance
+        # Read-only handle per query (only reached after a DB write, see above)
+        with closing(self.db.open_readonly()) as conn, closing(conn.cursor()) as cursor:
+            # Latest balances, count and sale/purchase totals in one pass
             cursor.execute("""
-                SELECT personal_balance, company_balance 
-                FROM transactions 
-                WHERE type != 'Opening'
-                ORDER BY id DESC 
-                LIMIT 1
+                SELECT
+                    (SELECT personal_balance FROM transactions
+                     WHERE type != 'Opening' ORDER BY id DESC LIMIT 1) AS personal_balance,
+                    (SELECT company_balance FROM transactions
+                     WHERE type != 'Opening' ORDER BY id DESC LIMIT 1) AS company_balance,
+                    COUNT(*) FILTER (WHERE type != 'Opening') AS transaction_count,
+                    COALESCE(SUM(total) FILTER (WHERE type = 'Sale'), 0) AS total_sales,
+                    COALESCE(SUM(total) FILTER (WHERE type = 'Purchase'), 0) AS total_purchases
+                FROM transactions
             """)
             row = cursor.fetchone()
-            if row:
-                summary['current_personal_balance'] = row['personal_balance'] or 0
-                summary['current_company_balance'] = row['company_balance'] or 0
-            
-            # Get transaction count (excluding Opening)
-            cursor.execute("SELECT COUNT(*) FROM transactions WHERE type != 'Opening'")
-            summary['transaction_count'] = cursor.fetchone()[0]
-            
-            # Get total sales
-            cursor.execute("""
-                SELECT COALESCE(SUM(total), 0) 
-                FROM transactions 
-                WHERE type = 'Sale'
-            """)
-            summary['total_sales'] = cursor.fetchone()[0]
-            
-            # Get total purchases
-            cursor.execute("""
-                SELECT COALESCE(SUM(total), 0) 
-                FROM transactions 
-                WHERE type = 'Purchase'
-            """)
-            summary['total_purchases'] = cursor.fetchone()[0]
+            summary['current_personal_balance'] = row['personal_balance'] or 0
+            summary['current_company_balance'] = row['company_balance'] or 0
+            summary['transaction_count'] = row['transaction_count']
+            summary['total_sales'] = row['total_sales']
+            summary['total_purchases'] = row['total_purchases']
         
+        self._summary_cache = (version, summary)
         return summary
@@ -7,13 +7,16 @@ Features:
 - Facility Planner: Factory buildings with Power Calculator and Setup Groups
 """
 
+from collections import namedtuple
+from difflib import SequenceMatcher
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QLabel,
     QPushButton,
@@ -33,15 +36,194 @@ from PyQt6.QtWidgets import (
     QTextEdit,
     QProgressBar,
     QAbstractItemView,
+    QStyledItemDelegate,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QTimer, QEvent
+from PyQt6.QtGui import QBrush, QColor, QFont, QStandardItem, QStandardItemModel
 
 from core.database import get_database
 from ui.tabs.factory_subtab import FACTORY_EQUIPMENT_DATA
 from ui.tabs.buildings_subtab import BUILDING_DATA
 
 
+# Memoized formatters for labels and table models; totals repeat a lot.
+# Values are rounded first so the caches are keyed on plain ints (float
+# prices and balances that print the same share one entry).
+def _fmt_usd(value):
+    return _fmt_usd_int(round(value))
+
+
+def _fmt_kw(value):
+    return _fmt_kw_int(round(value))
+
+
+@lru_cache(maxsize=4096)
+def _fmt_usd_int(value):
+    return f"${value:,}"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_kw_int(value):
+    return f"{value:,} kW"
+
+
+@lru_cache(maxsize=None)
+def _bold_font(size):
+    """Shared bold QFont per point size (created on first use, after QApplication)."""
+    return QFont("", size, QFont.Weight.Bold)
+
+
+# Style for the blue money totals
+_TOTAL_STYLE = "color: #0066cc;"
+
+
+def _set_text(label, text):
+    """setText only when the text differs (avoids a relayout and repaint)."""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _set_style(widget, style):
+    """setStyleSheet only when it differs; Qt re-polishes on every call."""
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
+
+
+# Fields every power setup carries; "name" and "buildings" are filled per setup
+_SETUP_DEFAULTS = {
+    "priority": "MEDIUM",
+    "include": True,
+    "power_source": None,
+    "power_cost": 0,
+    "power_capacity": 0,
+    "distribution_cost": 0,
+    "total_cost": 0,
+}
+
+
+def _new_setup(index, **fields):
+    """Return a power setup dict for position ``index`` with defaults filled in."""
+    setup = dict(_SETUP_DEFAULTS, name=f"Power Setup {index + 1}")
+    setup.update(fields)
+    setup["buildings"] = list(setup.get("buildings") or [])
+    return setup
+
+
+def _recompute_setup(setup):
+    """Write a setup's derived totals (facility_subtotal, power_required,
+    total_cost) from its buildings and stored power/distribution figures."""
+    facility = 0
+    required = 0
+    for bld in setup.get("buildings", []):
+        qty = bld.get("quantity", 1)
+        facility += bld.get("price", 0) * qty
+        required += bld.get("power_kw", 0) * qty
+    # Distribution power comes from power inputs and conveyors
+    required += setup.get("distribution_power", 0)
+    setup["facility_subtotal"] = facility
+    setup["power_required"] = required
+    setup["total_cost"] = facility + setup.get("power_cost", 0) + setup.get("distribution_cost", 0)
+
+
+_FactoryCatalog = namedtuple("_FactoryCatalog", "generators pylons conveyors power_inputs")
+
+
+def _gen_cost_per_kw(gen):
+    power = gen.get("power_generated_kw", 0)
+    if power > 0:
+        return gen.get("price", 0) / power
+    return float('inf')
+
+
+@lru_cache(maxsize=1)
+def _classified_factory_data():
+    """Categorize FACTORY_EQUIPMENT_DATA into power sources, pylons, conveyors
+    and power inputs. The static data never changes, so this runs once."""
+    generators = []
+    pylons = []
+    conveyors = []
+    power_inputs = []
+    
+    for item in FACTORY_EQUIPMENT_DATA:
+        cat = item.get("category", "")
+        subcat = item.get("subcategory", "")
+        
+        if cat == "Power":
+            if subcat in ["Generator", "Coal Plant", "Solar", "Wind"]:
+                generators.append(item)
+            elif "Pylon" in subcat:
+                pylons.append(item)
+            elif subcat == "Power Input":
+                # Store power inputs separately
+                power_inputs.append({
+                    "name": item.get("name", ""),
+                    "category": "Power Input",
+                    "price": item.get("price", 0),
+                    "power_kw": item.get("power_consumption_kw", 0),
+                })
+        elif cat == "Conveyor":
+            # Only include conveyors that use power (skip pipelines which are 0 kW)
+            power = item.get("power_consumption_kw", 0)
+            if power > 0:
+                conveyors.append(item)
+    
+    # Sort generators by $/kW (best value first)
+    generators.sort(key=_gen_cost_per_kw)
+    
+    return _FactoryCatalog(tuple(generators), tuple(pylons), tuple(conveyors), tuple(power_inputs))
+
+
+@lru_cache(maxsize=4)
+def _purchasable_items(db, write_version):
+    """Purchasable items sorted by name, as a tuple.
+    
+    Keyed on the database's write version, so any import or edit that
+    touches the DB yields a fresh list on the next call.
+    """
+    from importers.excel_importer import ExcelImporter
+    items = ExcelImporter(db).get_all_items()
+    return tuple(sorted((item for item in items if item.can_purchase), key=lambda x: x.name))
+
+
+def _generator_label(gen):
+    power = gen.get("power_generated_kw", 0)
+    price = gen.get("price", 0)
+    cost_per_kw = price / power if power > 0 else 0
+    return f"{gen.get('name', 'Unknown')} ({power:,} kW) - ${price:,} (${cost_per_kw:.2f}/kW)"
+
+
+def _power_input_label(pi):
+    return f"{pi.get('name', 'Unknown')} ({pi.get('power_kw', 0)} kW) - ${pi.get('price', 0):,}"
+
+
+def _conveyor_label(conv):
+    return (
+        f"{conv.get('name', 'Unknown')} ({conv.get('power_consumption_kw', 0)} kW)"
+        f" - ${conv.get('price', 0):,}"
+    )
+
+
+def _pylon_label(pylon):
+    return (
+        f"{pylon.get('name', 'Unknown')} ({pylon.get('max_capacity_kw', 0):,} kW)"
+        f" - ${pylon.get('price', 0):,}"
+    )
+
+
+def _building_label(bld):
+    return f"{bld.get('name', 'Unknown')} ({bld.get('power_kw', 0)} kW, ${bld.get('price', 0):,})"
+
+
+# Combo label per catalog kind (see BudgetPlannerTab.catalog_model)
+_CATALOG_LABELS = {
+    "generators": _generator_label,
+    "power_inputs": _power_input_label,
+    "conveyors": _conveyor_label,
+    "pylons": _pylon_label,
+    "buildings": _building_label,
+}
+
+
 class BudgetPlannerTab(QWidget):
     """Budget Planner tab with sub-tabs for equipment and facility planning."""
     
@@ -49,74 +231,119 @@ class BudgetPlannerTab(QWidget):
     
     # Priority levels
     PRIORITY_LEVELS = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+    PRIORITY_INDEX = {p: i for i, p in enumerate(PRIORITY_LEVELS)}
     PRIORITY_COLORS = {
         "CRITICAL": QColor(255, 200, 200),  # Light red
         "HIGH": QColor(255, 230, 200),       # Light orange
         "MEDIUM": QColor(255, 255, 200),     # Light yellow
         "LOW": QColor(200, 255, 200),        # Light green
     }
+    # Brushes built once, handed straight to BackgroundRole
+    PRIORITY_BRUSHES = {p: QBrush(c) for p, c in PRIORITY_COLORS.items()}
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.db = get_database()
         self.main_window = None
         
-        # Planned items storage
+        # Planned items storage (assigned through the sanitizing properties below)
         self.equipment_items = []  # List of dicts
         self.power_setups = []     # List of power setup groups
         
+        # Running overview aggregates, updated per changed object (see _update_overview)
+        self._totals = None
+        self._equipment_subtotals = {}  # id(item) -> included cost
+        self._setup_subtotals = {}      # id(setup) -> (buildings, power, kW required, distribution, kW capacity)
+        self._dirty = {}                # id(obj) -> obj changed since the last update
+        
         # Reference data caches
         self._generators = []
         self._pylons = []
         self._buildings = []
         self._conveyors = []
         
+        # Coalesce bursts of edits into one overview refresh
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(50)
+        self._update_timer.timeout.connect(self._flush_overview)
+        
+        self._catalog_models = {}  # See catalog_model()
+        
         self._load_reference_data()
         self._setup_ui()
         self._update_overview()
     
+    @staticmethod
+    def _sanitize(entries, kind):
+        """Drop non-dict entries (legacy/corrupt session data) once, at assignment."""
+        clean = [entry for entry in entries if isinstance(entry, dict)]
+        if len(clean) != len(entries):
+            print(f"Budget Planner: ignored {len(entries) - len(clean)} malformed {kind}")
+        return clean
+    
+    @property
+    def equipment_items(self):
+        return self._equipment_items
+    
+    @equipment_items.setter
+    def equipment_items(self, items):
+        self._equipment_items = self._sanitize(items, "equipment items")
+    
+    @property
+    def power_setups(self):
+        return self._power_setups
+    
+    @power_setups.setter
+    def power_setups(self, setups):
+        setups = self._sanitize(setups, "power setups")
+        # Normalize once here so PowerSetupWidget can trust the shape
+        setups = [_new_setup(i, **setup) for i, setup in enumerate(setups)]
+        for setup in setups:
+            setup["buildings"] = self._sanitize(setup["buildings"], "buildings")
+            _recompute_setup(setup)
+        self._power_setups = setups
+    
     def set_main_window(self, main_window):
         """Store reference to main window for accessing settings."""
         self.main_window = main_window
     
     def _load_reference_data(self):
-        """Load and categorize factory equipment data."""
-        # Categorize factory equipment
-        self._power_inputs = []
-        
-        for item in FACTORY_EQUIPMENT_DATA:
-            cat = item.get("category", "")
-            subcat = item.get("subcategory", "")
-            
-            if cat == "Power":
-                if subcat in ["Generator", "Coal Plant", "Solar", "Wind"]:
-                    self._generators.append(item)
-                elif "Pylon" in subcat:
-                    self._pylons.append(item)
-                elif subcat == "Power Input":
-                    # Store power inputs separately
-                    self._power_inputs.append({
-                        "name": item.get("name", ""),
-                        "category": "Power Input",
-                        "price": item.get("price", 0),
-                        "power_kw": item.get("power_consumption_kw", 0),
-                    })
-            elif cat == "Conveyor":
-                # Only include conveyors that use power (skip pipelines which are 0 kW)
-                power = item.get("power_consumption_kw", 0)
-                if power > 0:
-                    self._conveyors.append(item)
+        """Load the categorized factory equipment data (classified once per process)."""
+        catalog = _classified_factory_data()
+        self._generators = catalog.generators
+        self._pylons = catalog.pylons
+        self._conveyors = catalog.conveyors
+        self._power_inputs = catalog.power_inputs
         
         # Load buildings (without power inputs - they go in Distribution now)
         self._buildings = list(BUILDING_DATA)
-        
-        # Sort generators by $/kW (best value first)
-        def gen_cost_per_kw(g):
-            power = g.get("power_generated_kw", 0)
-            if power > 0:
-                return g.get("price", 0) / power
-            return float('inf')
-        self._generators.sort(key=gen_cost_per_kw)
+    
+    def catalog_model(self, kind):
+        """Shared combo model for one factory catalog.
+        
+        ``kind`` is "generators", "power_inputs", "conveyors", "pylons" or
+        "buildings". Built on first use, so each label is formatted once per
+        session, and shared by every combo showing that catalog. Each entry's
+        dict is stored under UserRole; the power catalogs start with a "None"
+        row since a setup may leave those slots empty.
+        """
+        model = self._catalog_models.get(kind)
+        if model is None:
+            model = QStandardItemModel(self)
+            label = _CATALOG_LABELS[kind]
+            rows = []
+            if kind != "buildings":
+                none_row = QStandardItem("None")
+                none_row.setData(None, Qt.ItemDataRole.UserRole)
+                rows.append(none_row)
+            for entry in getattr(self, "_" + kind):
+                row = QStandardItem(label(entry))
+                row.setData(entry, Qt.ItemDataRole.UserRole)
+                rows.append(row)
+            model.invisibleRootItem().appendRows(rows)
+            self._catalog_models[kind] = model
+        return model
     
     def _setup_ui(self):
         """Set up the user interface with sub-tabs."""
@@ -131,55 +358,163 @@ class BudgetPlannerTab(QWidget):
         self.overview_tab = BudgetOverviewSubTab(self)
         self.sub_tabs.addTab(self.overview_tab, "📊 Budget Overview")
         
-        # Equipment Planner Sub-Tab
+        # Equipment and Facility Planner Sub-Tabs are built on first visit
+        # (the equipment planner queries the item catalogue on construction)
+        self.equipment_tab = None
+        self.facility_tab = None
+        self._lazy_subtabs = {
+            self.sub_tabs.addTab(QWidget(), "🛠️ Equipment Planner"): self._build_equipment_tab,
+            self.sub_tabs.addTab(QWidget(), "🏭 Facility Planner"): self._build_facility_tab,
+        }
+        self.sub_tabs.currentChanged.connect(self._ensure_subtab_built)
+        
+        layout.addWidget(self.sub_tabs)
+    
+    def _build_equipment_tab(self):
         self.equipment_tab = EquipmentPlannerSubTab(self)
         self.equipment_tab.items_changed.connect(self._on_items_changed)
-        self.sub_tabs.addTab(self.equipment_tab, "🛠️ Equipment Planner")
-        
-        # Facility Planner Sub-Tab
+        return self.equipment_tab
+    
+    def _build_facility_tab(self):
         self.facility_tab = FacilityPlannerSubTab(self)
         self.facility_tab.setups_changed.connect(self._on_items_changed)
-        self.sub_tabs.addTab(self.facility_tab, "🏭 Facility Planner")
+        return self.facility_tab
+    
+    def _ensure_subtab_built(self, index):
+        """Swap a placeholder sub-tab for the real widget the first time it is shown."""
+        build = self._lazy_subtabs.pop(index, None)
+        if build is None:
+            return
         
-        layout.addWidget(self.sub_tabs)
+        placeholder = self.sub_tabs.widget(index)
+        label = self.sub_tabs.tabText(index)
+        widget = build()
+        
+        self.sub_tabs.blockSignals(True)
+        self.sub_tabs.insertTab(index, widget, label)
+        self.sub_tabs.removeTab(index + 1)
+        self.sub_tabs.setCurrentIndex(index)
+        self.sub_tabs.blockSignals(False)
+        placeholder.deleteLater()
     
     def _on_items_changed(self):
-        """Handle changes to planned items."""
+        """Handle changes to planned items (debounced; restarts a pending update)."""
+        self._update_timer.start()
+    
+    def _flush_overview(self):
+        """Apply the pending overview update and notify listeners."""
         self._update_overview()
         self.data_changed.emit()
     
+    def _refresh_facility_display(self):
+        """Re-sync the setup widgets after ``power_setups`` was replaced."""
+        self._invalidate_totals()
+        if self.facility_tab is not None:
+            self.facility_tab.reload()
+        self._update_overview()
+    
+    def _refresh_equipment_table(self):
+        """Re-sync views after ``equipment_items`` was replaced (session load/new)."""
+        self._invalidate_totals()
+        if self.equipment_tab is not None:
+            self.equipment_tab.reload()
+        self._update_overview()
+    
+    def _mark_dirty(self, obj):
+        """Record that a planned item or setup was added or edited in place."""
+        self._dirty[id(obj)] = obj
+    
+    def _forget(self, obj):
+        """Drop a removed planned item or setup from the running totals."""
+        self._dirty.pop(id(obj), None)
+        if self._totals is None:
+            return
+        key = id(obj)
+        if key in self._equipment_subtotals:
+            self._totals[0] -= self._equipment_subtotals.pop(key)
+        elif key in self._setup_subtotals:
+            for i, value in enumerate(self._setup_subtotals.pop(key), start=1):
+                self._totals[i] -= value
+    
+    def _invalidate_totals(self):
+        """Force the next overview update to rescan every item and setup."""
+        self._totals = None
+        self._dirty.clear()
+    
+    @staticmethod
+    def _equipment_subtotal(item):
+        if not item.get("include", True):
+            return 0
+        return item.get("price", 0) * item.get("quantity", 1)
+    
+    @staticmethod
+    def _setup_subtotal(setup):
+        # Derived fields are kept current by PowerSetupWidget._refresh
+        # (and _recompute_setup for restored setups)
+        if not setup.get("include", True):
+            return (0, 0, 0, 0, 0)
+        return (
+            setup.get("facility_subtotal", 0),
+            setup.get("power_cost", 0),
+            setup.get("power_required", 0),
+            setup.get("distribution_cost", 0),
+            setup.get("power_capacity", 0),
+        )
+    
+    def _rescan_totals(self):
+        """Recompute every subtotal from scratch."""
+        self._equipment_subtotals = {
+            id(item): self._equipment_subtotal(item) for item in self.equipment_items
+        }
+        self._setup_subtotals = {
+            id(setup): self._setup_subtotal(setup) for setup in self.power_setups
+        }
+        # Column-wise reduction over the per-setup subtotal tuples
+        setup_totals = [sum(col) for col in zip(*self._setup_subtotals.values())] or [0] * 5
+        self._totals = [sum(self._equipment_subtotals.values()), *setup_totals]
+        self._dirty.clear()
+    
+    def _apply_dirty(self):
+        """Fold changed objects into the running totals."""
+        totals = self._totals
+        for key, obj in self._dirty.items():
+            if key in self._equipment_subtotals:
+                new = self._equipment_subtotal(obj)
+                totals[0] += new - self._equipment_subtotals[key]
+                self._equipment_subtotals[key] = new
+            elif key in self._setup_subtotals:
+                new = self._setup_subtotal(obj)
+                for i, (old_value, value) in enumerate(zip(self._setup_subtotals[key], new), start=1):
+                    totals[i] += value - old_value
+                self._setup_subtotals[key] = new
+            elif any(item is obj for item in self.equipment_items):
+                new = self._equipment_subtotal(obj)
+                totals[0] += new
+                self._equipment_subtotals[key] = new
+            elif any(setup is obj for setup in self.power_setups):
+                new = self._setup_subtotal(obj)
+                for i, value in enumerate(new, start=1):
+                    totals[i] += value
+                self._setup_subtotals[key] = new
+        self._dirty.clear()
+    
+    def _current_totals(self):
+        """Return the running totals, folding in pending changes first.
+        
+        (equipment, facility, power, kW required, distribution, kW capacity).
+        Only items and setups marked dirty since the last call are
+        re-traversed; a full rescan happens after _invalidate_totals.
+        """
+        if self._totals is None:
+            self._rescan_totals()
+        elif self._dirty:
+            self._apply_dirty()
+        return self._totals
+    
     def _update_overview(self):
         """Update the overview tab with current totals."""
-        # Calculate equipment totals
-        equipment_total = sum(
-            item.get("price", 0) * item.get("quantity", 1)
-            for item in self.equipment_items
-            if isinstance(item, dict) and item.get("include", True)
-        )
-        
-        # Calculate facility totals
-        facility_total = 0
-        power_total = 0
-        power_required = 0
-        distribution_total = 0
-        
-        for setup in self.power_setups:
-            # Skip non-dict entries
-            if not isinstance(setup, dict):
-                continue
-            if not setup.get("include", True):
-                continue
-            # Buildings
-            for bld in setup.get("buildings", []):
-                if isinstance(bld, dict):
-                    facility_total += bld.get("price", 0) * bld.get("quantity", 1)
-                    power_required += bld.get("power_kw", 0) * bld.get("quantity", 1)
-            # Power source
-            power_total += setup.get("power_cost", 0)
-            # Distribution (includes power inputs and conveyors)
-            distribution_total += setup.get("distribution_cost", 0)
-            # Add distribution power (from power inputs and conveyors)
-            power_required += setup.get("distribution_power", 0)
+        (equipment_total, facility_total, power_total,
+         power_required, distribution_total, power_capacity) = self._current_totals()
         
         # Update overview tab
         self.overview_tab.update_totals(
@@ -188,6 +523,7 @@ class BudgetPlannerTab(QWidget):
             power_total=power_total,
             power_required=power_required,
             distribution_total=distribution_total,
+            power_capacity=power_capacity,
             equipment_items=self.equipment_items,
             power_setups=self.power_setups,
         )
@@ -226,12 +562,160 @@ class BudgetPlannerTab(QWidget):
         return settings_data
 
 
+class PriorityQueueModel(QAbstractTableModel):
+    """Read-only model for the overview's priority queue.
+    
+    Rows are plain dicts (priority, type, name, quantity, cost); the running
+    cumulative cost is computed once per update rather than per paint.
+    Only the first ``_fetched`` rows are exposed; views pull in more in
+    FETCH_BATCH steps via canFetchMore/fetchMore as they scroll.
+    """
+    
+    HEADERS = ["Priority", "Type", "Name", "Qty", "Cost", "Cumulative"]
+    FETCH_BATCH = 50
+    
+    def __init__(self, priority_brushes, parent=None):
+        super().__init__(parent)
+        self._priority_brushes = priority_brushes
+        self._rows = []
+        self._cumulative = []
+        self._fetched = 0
+    
+    @staticmethod
+    def _row_key(row):
+        return (row["priority"], row["type"], row["name"])
+    
+    def set_rows(self, rows):
+        """Update the queue to ``rows`` (already sorted), touching only what changed.
+        
+        Rows are matched on (priority, type, name); unmatched runs become
+        row inserts/removes and matched rows with new values emit dataChanged.
+        Changes past the fetched prefix are applied silently.
+        """
+        old_rows = self._rows
+        last_col = len(self.HEADERS) - 1
+        
+        old_cumulative = self._cumulative
+        cumulative = []
+        running = 0
+        for row in rows:
+            running += row["cost"]
+            cumulative.append(running)
+        self._cumulative = cumulative
+        
+        if not old_rows:
+            # Fresh load: expose the first batch only
+            self.beginResetModel()
+            self._rows = list(rows)
+            self._fetched = min(len(rows), self.FETCH_BATCH)
+            self.endResetModel()
+            return
+        
+        matcher = SequenceMatcher(
+            None, [self._row_key(r) for r in old_rows], [self._row_key(r) for r in rows],
+            autojunk=False,
+        )
+        # Apply back to front so earlier row numbers stay valid
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            overlap = min(i2 - i1, j2 - j1)
+            for offset in range(overlap):
+                if old_rows[i1 + offset] != rows[j1 + offset]:
+                    old_rows[i1 + offset] = rows[j1 + offset]
+                    if i1 + offset < self._fetched:
+                        self.dataChanged.emit(
+                            self.index(i1 + offset, 0), self.index(i1 + offset, last_col)
+                        )
+            start = i1 + overlap
+            if i2 - i1 > overlap:
+                visible_end = min(i2, self._fetched) - 1
+                if start <= visible_end:
+                    self.beginRemoveRows(QModelIndex(), start, visible_end)
+                    del old_rows[start:i2]
+                    self._fetched -= visible_end - start + 1
+                    self.endRemoveRows()
+                else:
+                    del old_rows[start:i2]
+            elif j2 - j1 > overlap:
+                count = (j2 - j1) - overlap
+                if start <= self._fetched:
+                    self.beginInsertRows(QModelIndex(), start, start + count - 1)
+                    old_rows[start:start] = rows[j1 + overlap:j2]
+                    self._fetched += count
+                    self.endInsertRows()
+                else:
+                    old_rows[start:start] = rows[j1 + overlap:j2]
+        
+        # Cumulative costs change from the first differing row downwards
+        for first, value in enumerate(cumulative[:self._fetched]):
+            if first >= len(old_cumulative) or old_cumulative[first] != value:
+                self.dataChanged.emit(
+                    self.index(first, last_col), self.index(self._fetched - 1, last_col)
+                )
+                break
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._fetched
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetched < len(self._rows)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._rows) - self._fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = self._rows[index.row()]
+        col = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return row["priority"]
+            if col == 1:
+                return row["type"]
+            if col == 2:
+                return row["name"]
+            if col == 3:
+                return str(row["quantity"])
+            if col == 4:
+                return _fmt_usd(row["cost"])
+            if index.row() < len(self._cumulative):
+                return _fmt_usd(self._cumulative[index.row()])
+            return None
+        
+        if role == Qt.ItemDataRole.BackgroundRole and col == 0:
+            return self._priority_brushes.get(row["priority"])
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole and col >= 4:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        
+        return None
+
+
 class BudgetOverviewSubTab(QWidget):
     """Budget Overview showing aggregated totals and priority queue."""
     
     def __init__(self, parent_tab):
         super().__init__()
         self.parent_tab = parent_tab
+        self._grand_total = 0  # Last grand total passed to update_totals
+        self._last_queue_key = None  # Inputs the priority queue was last built from
         self._setup_ui()
     
     def _setup_ui(self):
@@ -250,7 +734,7 @@ class BudgetOverviewSubTab(QWidget):
         status_layout.addWidget(self.status_icon)
         
         self.status_label = QLabel("CAN AFFORD ALL PLANNED ITEMS")
-        self.status_label.setFont(QFont("", 14, QFont.Weight.Bold))
+        self.status_label.setFont(_bold_font(14))
         status_layout.addWidget(self.status_label)
         status_layout.addStretch()
         
@@ -264,7 +748,7 @@ class BudgetOverviewSubTab(QWidget):
         equip_group = QGroupBox("🛠️ Equipment")
         equip_layout = QFormLayout(equip_group)
         self.equip_total_label = QLabel("$0")
-        self.equip_total_label.setFont(QFont("", 12, QFont.Weight.Bold))
+        self.equip_total_label.setFont(_bold_font(12))
         equip_layout.addRow("Total:", self.equip_total_label)
         self.equip_count_label = QLabel("0 items")
         equip_layout.addRow("Items:", self.equip_count_label)
@@ -274,7 +758,7 @@ class BudgetOverviewSubTab(QWidget):
         facility_group = QGroupBox("🏭 Facility")
         facility_layout = QFormLayout(facility_group)
         self.facility_total_label = QLabel("$0")
-        self.facility_total_label.setFont(QFont("", 12, QFont.Weight.Bold))
+        self.facility_total_label.setFont(_bold_font(12))
         facility_layout.addRow("Buildings:", self.facility_total_label)
         self.power_total_label = QLabel("$0")
         facility_layout.addRow("Power:", self.power_total_label)
@@ -286,7 +770,7 @@ class BudgetOverviewSubTab(QWidget):
         power_group = QGroupBox("⚡ Power Summary")
         power_layout = QFormLayout(power_group)
         self.power_required_label = QLabel("0 kW")
-        self.power_required_label.setFont(QFont("", 12, QFont.Weight.Bold))
+        self.power_required_label.setFont(_bold_font(12))
         power_layout.addRow("Required:", self.power_required_label)
         self.power_capacity_label = QLabel("0 kW")
         power_layout.addRow("Capacity:", self.power_capacity_label)
@@ -298,8 +782,8 @@ class BudgetOverviewSubTab(QWidget):
         total_group = QGroupBox("💰 Grand Total")
         total_layout = QFormLayout(total_group)
         self.grand_total_label = QLabel("$0")
-        self.grand_total_label.setFont(QFont("", 16, QFont.Weight.Bold))
-        self.grand_total_label.setStyleSheet("color: #0066cc;")
+        self.grand_total_label.setFont(_bold_font(16))
+        self.grand_total_label.setStyleSheet(_TOTAL_STYLE)
         total_layout.addRow("", self.grand_total_label)
         
         # Available with refresh button
@@ -341,20 +825,21 @@ class BudgetOverviewSubTab(QWidget):
         queue_group = QGroupBox("🎯 Priority Queue")
         queue_layout = QVBoxLayout(queue_group)
         
-        self.queue_table = QTableWidget()
-        self.queue_table.setColumnCount(6)
-        self.queue_table.setHorizontalHeaderLabels([
-            "Priority", "Type", "Name", "Qty", "Cost", "Cumulative"
-        ])
+        self.queue_model = PriorityQueueModel(self.parent_tab.PRIORITY_BRUSHES)
+        self.queue_table = QTableView()
+        self.queue_table.setModel(self.queue_model)
         self.queue_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.queue_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.queue_table.setAlternatingRowColors(True)
+        self.queue_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.queue_table.verticalHeader().setDefaultSectionSize(22)
         queue_layout.addWidget(self.queue_table)
         
         layout.addWidget(queue_group)
     
     def update_totals(self, equipment_total, facility_total, power_total,
-                      power_required, distribution_total, equipment_items, power_setups):
+                      power_required, distribution_total, power_capacity,
+                      equipment_items, power_setups):
         """Update all overview displays."""
         # Get available funds
         settings = self.parent_tab.get_settings()
@@ -363,71 +848,42 @@ class BudgetOverviewSubTab(QWidget):
         
         # Calculate totals
         grand_total = equipment_total + facility_total + power_total + distribution_total
-        shortfall = max(0, grand_total - available)
-        
-        # Calculate power capacity from setups
-        power_capacity = 0
-        for setup in power_setups:
-            if not isinstance(setup, dict):
-                continue
-            if setup.get("include", True):
-                power_capacity += setup.get("power_capacity", 0)
         
         # Update labels
-        self.equip_total_label.setText(f"${equipment_total:,.0f}")
-        included_count = sum(1 for i in equipment_items if isinstance(i, dict) and i.get("include", True))
-        self.equip_count_label.setText(f"{included_count} items")
+        _set_text(self.equip_total_label, _fmt_usd(equipment_total))
+        included_count = sum(1 for i in equipment_items if i.get("include", True))
+        _set_text(self.equip_count_label, f"{included_count} items")
         
-        self.facility_total_label.setText(f"${facility_total:,.0f}")
-        self.power_total_label.setText(f"${power_total:,.0f}")
-        self.distribution_label.setText(f"${distribution_total:,.0f}")
+        _set_text(self.facility_total_label, _fmt_usd(facility_total))
+        _set_text(self.power_total_label, _fmt_usd(power_total))
+        _set_text(self.distribution_label, _fmt_usd(distribution_total))
         
-        self.power_required_label.setText(f"{power_required:,.0f} kW")
-        self.power_capacity_label.setText(f"{power_capacity:,.0f} kW")
+        _set_text(self.power_required_label, _fmt_kw(power_required))
+        _set_text(self.power_capacity_label, _fmt_kw(power_capacity))
         headroom = power_capacity - power_required
         headroom_pct = (headroom / power_capacity * 100) if power_capacity > 0 else 0
-        self.power_headroom_label.setText(f"{headroom:,.0f} kW ({headroom_pct:.0f}%)")
-        
-        self.grand_total_label.setText(f"${grand_total:,.0f}")
-        self.available_label.setText(f"${available:,.0f}")
-        
-        # Shortfall styling
-        if shortfall > 0:
-            self.shortfall_label.setText(f"-${shortfall:,.0f}")
-            self.shortfall_label.setStyleSheet("color: red; font-weight: bold;")
-        else:
-            surplus = available - grand_total
-            self.shortfall_label.setText(f"+${surplus:,.0f}")
-            self.shortfall_label.setStyleSheet("color: green; font-weight: bold;")
-        
-        # Update status banner
-        if shortfall > 0:
-            self.status_icon.setText("⚠️")
-            self.status_label.setText("OVER BUDGET")
-            self.status_frame.setStyleSheet("background-color: #ffcccc;")
-        else:
-            self.status_icon.setText("✅")
-            self.status_label.setText("CAN AFFORD ALL PLANNED ITEMS")
-            self.status_frame.setStyleSheet("background-color: #ccffcc;")
-        
-        # Update progress bar
-        if grand_total > 0:
-            progress = min(100, int(available / grand_total * 100))
-            self.progress_bar.setValue(progress)
-        else:
-            self.progress_bar.setValue(100)
-        
-        # Revenue needed calculation
-        if shortfall > 0 and personal_split > 0:
-            revenue_needed = shortfall / (personal_split / 100)
-            self.revenue_needed_label.setText(
-                f"Revenue needed: ${revenue_needed:,.0f} gross (at {personal_split}% split)"
-            )
-        else:
-            self.revenue_needed_label.setText("Fully funded!")
-        
-        # Update priority queue
-        self._update_queue(equipment_items, power_setups)
+        _set_text(self.power_headroom_label, f"{headroom:,.0f} kW ({headroom_pct:.0f}%)")
+        
+        self._grand_total = grand_total
+        _set_text(self.grand_total_label, _fmt_usd(grand_total))
+        self._apply_totals(grand_total, available, personal_split)
+        
+        # Update priority queue, unless nothing it shows has changed
+        queue_key = (
+            tuple(
+                (id(i), i.get("include", True), i.get("priority"), i.get("name"),
+                 i.get("quantity"), i.get("price"))
+                for i in equipment_items
+            ),
+            tuple(
+                (id(s), s.get("include", True), s.get("priority"), s.get("name"),
+                 s.get("total_cost"))
+                for s in power_setups
+            ),
+        )
+        if queue_key != self._last_queue_key:
+            self._last_queue_key = queue_key
+            self._update_queue(equipment_items, power_setups)
     
     def _update_queue(self, equipment_items, power_setups):
         """Build and display the priority queue."""
@@ -435,8 +891,6 @@ class BudgetOverviewSubTab(QWidget):
         all_items = []
         
         for item in equipment_items:
-            if not isinstance(item, dict):
-                continue
             if item.get("include", True):
                 all_items.append({
                     "priority": item.get("priority", "MEDIUM"),
@@ -447,8 +901,6 @@ class BudgetOverviewSubTab(QWidget):
                 })
         
         for setup in power_setups:
-            if not isinstance(setup, dict):
-                continue
             if setup.get("include", True):
                 setup_cost = setup.get("total_cost", 0)
                 all_items.append({
@@ -460,66 +912,40 @@ class BudgetOverviewSubTab(QWidget):
                 })
         
         # Sort by priority
-        priority_order = {p: i for i, p in enumerate(self.parent_tab.PRIORITY_LEVELS)}
-        all_items.sort(key=lambda x: priority_order.get(x["priority"], 99))
-        
-        # Populate table
-        self.queue_table.setRowCount(len(all_items))
-        cumulative = 0
+        priority_index = BudgetPlannerTab.PRIORITY_INDEX
+        all_items.sort(key=lambda x: priority_index.get(x["priority"], 99))
         
-        for row, item in enumerate(all_items):
-            cumulative += item["cost"]
-            
-            priority_item = QTableWidgetItem(item["priority"])
-            priority_color = self.parent_tab.PRIORITY_COLORS.get(item["priority"])
-            if priority_color:
-                priority_item.setBackground(priority_color)
-            self.queue_table.setItem(row, 0, priority_item)
-            
-            self.queue_table.setItem(row, 1, QTableWidgetItem(item["type"]))
-            self.queue_table.setItem(row, 2, QTableWidgetItem(item["name"]))
-            self.queue_table.setItem(row, 3, QTableWidgetItem(str(item["quantity"])))
-            
-            cost_item = QTableWidgetItem(f"${item['cost']:,.0f}")
-            cost_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.queue_table.setItem(row, 4, cost_item)
-            
-            cum_item = QTableWidgetItem(f"${cumulative:,.0f}")
-            cum_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.queue_table.setItem(row, 5, cum_item)
+        # A diff can emit many row/dataChanged signals; repaint once afterwards
+        self.queue_table.setUpdatesEnabled(False)
+        self.queue_model.set_rows(all_items)
+        self.queue_table.setUpdatesEnabled(True)
     
     def _refresh_balance(self):
         """Refresh the available balance from the Ledger."""
         # Get fresh balance from Ledger
         settings = self.parent_tab.get_settings()
-        available = settings["personal_balance"]
-        
-        # Update the label
-        self.available_label.setText(f"${available:,.0f}")
-        
-        # Recalculate shortfall with current grand total
-        grand_total_text = self.grand_total_label.text().replace("$", "").replace(",", "")
-        try:
-            grand_total = float(grand_total_text)
-        except ValueError:
-            grand_total = 0
-        
+        self._apply_totals(self._grand_total, settings["personal_balance"], settings["personal_split"])
+    
+    def _apply_totals(self, grand_total, available, personal_split):
+        """Update the balance, shortfall, status banner, progress and revenue displays."""
         shortfall = max(0, grand_total - available)
         
-        # Update shortfall styling
+        _set_text(self.available_label, _fmt_usd(available))
+        
+        # Shortfall styling and status banner
         if shortfall > 0:
-            self.shortfall_label.setText(f"-${shortfall:,.0f}")
-            self.shortfall_label.setStyleSheet("color: red; font-weight: bold;")
-            self.status_icon.setText("⚠️")
-            self.status_label.setText("OVER BUDGET")
-            self.status_frame.setStyleSheet("background-color: #ffcccc;")
+            _set_text(self.shortfall_label, "-" + _fmt_usd(shortfall))
+            _set_style(self.shortfall_label, "color: red; font-weight: bold;")
+            _set_text(self.status_icon, "⚠️")
+            _set_text(self.status_label, "OVER BUDGET")
+            _set_style(self.status_frame, "background-color: #ffcccc;")
         else:
             surplus = available - grand_total
-            self.shortfall_label.setText(f"+${surplus:,.0f}")
-            self.shortfall_label.setStyleSheet("color: green; font-weight: bold;")
-            self.status_icon.setText("✅")
-            self.status_label.setText("CAN AFFORD ALL PLANNED ITEMS")
-            self.status_frame.setStyleSheet("background-color: #ccffcc;")
+            _set_text(self.shortfall_label, "+" + _fmt_usd(surplus))
+            _set_style(self.shortfall_label, "color: green; font-weight: bold;")
+            _set_text(self.status_icon, "✅")
+            _set_text(self.status_label, "CAN AFFORD ALL PLANNED ITEMS")
+            _set_style(self.status_frame, "background-color: #ccffcc;")
         
         # Update progress bar
         if grand_total > 0:
@@ -528,15 +954,189 @@ class BudgetOverviewSubTab(QWidget):
         else:
             self.progress_bar.setValue(100)
         
-        # Update revenue needed
-        personal_split = settings["personal_split"]
+        # Revenue needed calculation
         if shortfall > 0 and personal_split > 0:
             revenue_needed = shortfall / (personal_split / 100)
-            self.revenue_needed_label.setText(
+            _set_text(
+                self.revenue_needed_label,
                 f"Revenue needed: ${revenue_needed:,.0f} gross (at {personal_split}% split)"
             )
         else:
-            self.revenue_needed_label.setText("Fully funded!")
+            _set_text(self.revenue_needed_label, "Fully funded!")
+
+
+class EquipmentItemsModel(QAbstractTableModel):
+    """Table model over the budget tab's planned equipment list.
+    
+    Reads ``parent_tab.equipment_items`` directly so the list stays the single
+    source of truth. Include is a checkable column; Qty and Notes are editable
+    in place.
+    """
+    
+    HEADERS = ["Include", "Priority", "Name", "Unit Price", "Qty", "Total", "Notes"]
+    
+    COL_INCLUDE = 0
+    COL_QTY = 4
+    COL_TOTAL = 5
+    COL_NOTES = 6
+    
+    def __init__(self, parent_tab, parent=None):
+        super().__init__(parent)
+        self.parent_tab = parent_tab
+        # Per-row cell values as last shown; lets reload() signal only changes
+        self._rendered = [self._row_key(item) for item in self._items]
+    
+    @property
+    def _items(self):
+        return self.parent_tab.equipment_items
+    
+    @staticmethod
+    def _row_key(item):
+        """Source values for each column, in column order."""
+        return (
+            item.get("include", True),
+            item.get("priority", "MEDIUM"),
+            item.get("name", ""),
+            item.get("price", 0),
+            item.get("quantity", 1),
+            item.get("price", 0) * item.get("quantity", 1),
+            item.get("notes", ""),
+        )
+    
+    def reload(self):
+        """Re-read the backing list after it was replaced wholesale.
+        
+        When the row count is unchanged only the cells whose values differ
+        from what was last shown are signalled; otherwise the model resets.
+        """
+        keys = [self._row_key(item) for item in self._items]
+        if len(keys) != len(self._rendered):
+            self.beginResetModel()
+            self._rendered = keys
+            self.endResetModel()
+            return
+        
+        old_keys, self._rendered = self._rendered, keys
+        for row, (old, new) in enumerate(zip(old_keys, keys)):
+            if old == new:
+                continue
+            changed = [col for col, (a, b) in enumerate(zip(old, new)) if a != b]
+            self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+    
+    def append_item(self, item):
+        """Append a planned item and notify attached views."""
+        row = len(self._items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.append(item)
+        self._rendered.append(self._row_key(item))
+        self.endInsertRows()
+    
+    def remove_rows(self, rows):
+        """Remove the given row numbers from the planned list."""
+        for row in sorted(set(rows), reverse=True):
+            if 0 <= row < len(self._items):
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._items[row]
+                del self._rendered[row]
+                self.endRemoveRows()
+    
+    def clear(self):
+        """Remove every planned item."""
+        self.beginResetModel()
+        self._items.clear()
+        self._rendered = []
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        col = index.column()
+        if col == self.COL_INCLUDE:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        elif col in (self.COL_QTY, self.COL_NOTES):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        item = self._items[index.row()]
+        col = index.column()
+        
+        if role == Qt.ItemDataRole.CheckStateRole and col == self.COL_INCLUDE:
+            if item.get("include", True):
+                return Qt.CheckState.Checked
+            return Qt.CheckState.Unchecked
+        
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if col == 1:
+                return item.get("priority", "MEDIUM")
+            if col == 2:
+                return item.get("name", "")
+            if col == 3:
+                return _fmt_usd(item.get("price", 0))
+            if col == self.COL_QTY:
+                qty = item.get("quantity", 1)
+                return qty if role == Qt.ItemDataRole.EditRole else str(qty)
+            if col == self.COL_TOTAL:
+                return _fmt_usd(item.get("price", 0) * item.get("quantity", 1))
+            if col == self.COL_NOTES:
+                return item.get("notes", "")
+            return None
+        
+        if role == Qt.ItemDataRole.BackgroundRole and col == 1:
+            return self.parent_tab.PRIORITY_BRUSHES.get(item.get("priority"))
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole and col in (3, self.COL_TOTAL):
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+        
+        item = self._items[index.row()]
+        col = index.column()
+        
+        if role == Qt.ItemDataRole.CheckStateRole and col == self.COL_INCLUDE:
+            item["include"] = Qt.CheckState(value) == Qt.CheckState.Checked
+            self._rendered[index.row()] = self._row_key(item)
+            self.dataChanged.emit(index, index, [role])
+            return True
+        
+        if role == Qt.ItemDataRole.EditRole:
+            if col == self.COL_QTY:
+                try:
+                    qty = int(value)
+                except (TypeError, ValueError):
+                    return False
+                if qty < 1:
+                    return False
+                item["quantity"] = qty
+                self._rendered[index.row()] = self._row_key(item)
+                self.dataChanged.emit(index, index.siblingAtColumn(self.COL_TOTAL))
+                return True
+            if col == self.COL_NOTES:
+                item["notes"] = str(value)
+                self._rendered[index.row()] = self._row_key(item)
+                self.dataChanged.emit(index, index)
+                return True
+        
+        return False
 
 
 class EquipmentPlannerSubTab(QWidget):
@@ -548,6 +1148,9 @@ class EquipmentPlannerSubTab(QWidget):
         super().__init__()
         self.parent_tab = parent_tab
         self._items_cache = []  # Cache of purchasable items
+        self._search_keys = []  # (name lower, category lower, item) per cached item
+        self._last_search = None  # (search text, category) of the last filter pass
+        self._last_filtered = []
         self._setup_ui()
     
     def _setup_ui(self):
@@ -566,7 +1169,11 @@ class EquipmentPlannerSubTab(QWidget):
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Type to search items...")
         self.search_edit.setClearButtonEnabled(True)
-        self.search_edit.textChanged.connect(self._filter_items)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._filter_items)
+        self.search_edit.textChanged.connect(lambda _text: self._filter_timer.start())
         self.search_edit.setMinimumWidth(200)
         filter_row.addWidget(self.search_edit)
         
@@ -628,22 +1235,23 @@ class EquipmentPlannerSubTab(QWidget):
         toolbar.addStretch()
         
         self.total_label = QLabel("Total: $0")
-        self.total_label.setFont(QFont("", 12, QFont.Weight.Bold))
+        self.total_label.setFont(_bold_font(12))
         toolbar.addWidget(self.total_label)
         
         table_layout.addLayout(toolbar)
         
         # Main table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "Include", "Priority", "Name", "Unit Price", "Qty", "Total", "Notes"
-        ])
+        self.model = EquipmentItemsModel(self.parent_tab)
+        self.model.dataChanged.connect(self._on_model_edited)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         self.table.setColumnWidth(0, 60)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(22)
         table_layout.addWidget(self.table)
         
         layout.addWidget(table_group)
@@ -654,16 +1262,16 @@ class EquipmentPlannerSubTab(QWidget):
         self._items_cache = []
         self._categories = set()
         
-        # Get items from importer
-        from importers.excel_importer import ExcelImporter
-        importer = ExcelImporter(self.parent_tab.db)
-        items = importer.get_all_items()
-        
-        # Filter to items that can be purchased and sort by name
-        purchasable = [item for item in items if item.can_purchase]
-        purchasable.sort(key=lambda x: x.name)
+        db = self.parent_tab.db
+        purchasable = _purchasable_items(db, db.write_version())
         
         self._items_cache = purchasable
+        # (name, category) lowered once for the search filter
+        self._search_keys = [
+            (item.name.lower(), (item.category or "").lower(), item) for item in purchasable
+        ]
+        self._last_search = None
+        self._last_filtered = self._search_keys
         
         # Collect categories
         for item in purchasable:
@@ -680,21 +1288,37 @@ class EquipmentPlannerSubTab(QWidget):
         self._update_item_combo(purchasable)
     
     def _update_item_combo(self, items):
-        """Update the item combo with the given items."""
-        self.item_combo.clear()
+        """Update the item combo with the given items (one bulk model insert)."""
+        rows = []
         for item in items:
-            name = item.name
             price = item.buy_price or 0
             category = item.category or ""
-            self.item_combo.addItem(f"{name} (${price:,.0f}) [{category}]", item)
+            row = QStandardItem(f"{item.name} (${price:,.0f}) [{category}]")
+            row.setData(item, Qt.ItemDataRole.UserRole)
+            rows.append(row)
+        
+        self.item_combo.setUpdatesEnabled(False)
+        self.item_combo.blockSignals(True)
+        self.item_combo.clear()
+        if rows:
+            self.item_combo.model().invisibleRootItem().appendRows(rows)
+        self.item_combo.blockSignals(False)
+        self.item_combo.setUpdatesEnabled(True)
     
     def _filter_items(self):
         """Filter items based on search text and category."""
         search_text = self.search_edit.text().lower().strip()
         selected_category = self.category_combo.currentText()
         
+        # Typing further only narrows the previous result
+        last = self._last_search
+        if last is not None and last[1] == selected_category and search_text.startswith(last[0]):
+            candidates = self._last_filtered
+        else:
+            candidates = self._search_keys
+        
         filtered = []
-        for item in self._items_cache:
+        for name_lower, cat_lower, item in candidates:
             # Category filter
             if selected_category != "All Categories":
                 if item.category != selected_category:
@@ -702,14 +1326,14 @@ class EquipmentPlannerSubTab(QWidget):
             
             # Search filter
             if search_text:
-                name_match = search_text in item.name.lower()
-                cat_match = search_text in (item.category or "").lower()
-                if not (name_match or cat_match):
+                if search_text not in name_lower and search_text not in cat_lower:
                     continue
             
-            filtered.append(item)
+            filtered.append((name_lower, cat_lower, item))
         
-        self._update_item_combo(filtered)
+        self._last_search = (search_text, selected_category)
+        self._last_filtered = filtered
+        self._update_item_combo([entry[2] for entry in filtered])
     
     def _add_item(self):
         """Add item to the planned list."""
@@ -732,81 +1356,40 @@ class EquipmentPlannerSubTab(QWidget):
             "category": item_data.category or "",
         }
         
-        self.parent_tab.equipment_items.append(planned)
-        self._refresh_table()
+        self.parent_tab._mark_dirty(planned)
+        self.model.append_item(planned)
+        self._update_total()
         self.items_changed.emit()
     
-    def _refresh_table(self):
-        """Refresh the equipment table."""
-        items = self.parent_tab.equipment_items
-        self.table.setRowCount(len(items))
-        
-        total = 0
-        
-        for row, item in enumerate(items):
-            # Skip non-dict entries
-            if not isinstance(item, dict):
-                continue
-                
-            # Include checkbox
-            include_check = QCheckBox()
-            include_check.setChecked(item.get("include", True))
-            include_check.stateChanged.connect(lambda state, r=row: self._toggle_include(r, state))
-            cell_widget = QWidget()
-            cell_layout = QHBoxLayout(cell_widget)
-            cell_layout.addWidget(include_check)
-            cell_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            cell_layout.setContentsMargins(0, 0, 0, 0)
-            self.table.setCellWidget(row, 0, cell_widget)
-            
-            # Priority
-            priority_item = QTableWidgetItem(item.get("priority", "MEDIUM"))
-            priority_color = self.parent_tab.PRIORITY_COLORS.get(item.get("priority"))
-            if priority_color:
-                priority_item.setBackground(priority_color)
-            self.table.setItem(row, 1, priority_item)
-            
-            # Name
-            self.table.setItem(row, 2, QTableWidgetItem(item.get("name", "")))
-            
-            # Unit Price
-            price = item.get("price", 0)
-            price_item = QTableWidgetItem(f"${price:,.0f}")
-            price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 3, price_item)
-            
-            # Quantity
-            qty = item.get("quantity", 1)
-            self.table.setItem(row, 4, QTableWidgetItem(str(qty)))
-            
-            # Total
-            item_total = price * qty
-            total_item = QTableWidgetItem(f"${item_total:,.0f}")
-            total_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 5, total_item)
-            
-            if item.get("include", True):
-                total += item_total
-            
-            # Notes
-            self.table.setItem(row, 6, QTableWidgetItem(item.get("notes", "")))
-        
-        self.total_label.setText(f"Total: ${total:,.0f}")
+    def reload(self):
+        """Re-read the planned list after it was replaced (e.g. session load)."""
+        self.model.reload()
+        self._update_total()
     
-    def _toggle_include(self, row, state):
-        """Toggle item inclusion."""
-        if row < len(self.parent_tab.equipment_items):
-            self.parent_tab.equipment_items[row]["include"] = (state == Qt.CheckState.Checked.value)
-            self._refresh_table()
-            self.items_changed.emit()
+    def _update_total(self):
+        """Update the included-items total label."""
+        total = sum(
+            item.get("price", 0) * item.get("quantity", 1)
+            for item in self.parent_tab.equipment_items
+            if item.get("include", True)
+        )
+        _set_text(self.total_label, "Total: " + _fmt_usd(total))
+    
+    def _on_model_edited(self, top_left, bottom_right, roles=()):
+        """Handle in-place edits (Include, Qty, Notes) made through the table."""
+        items = self.parent_tab.equipment_items
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self.parent_tab._mark_dirty(items[row])
+        self._update_total()
+        self.items_changed.emit()
     
     def _remove_selected(self):
         """Remove selected items."""
-        rows = set(item.row() for item in self.table.selectedItems())
-        for row in sorted(rows, reverse=True):
-            if row < len(self.parent_tab.equipment_items):
-                del self.parent_tab.equipment_items[row]
-        self._refresh_table()
+        rows = [index.row() for index in self.table.selectionModel().selectedRows()]
+        for row in rows:
+            self.parent_tab._forget(self.parent_tab.equipment_items[row])
+        self.model.remove_rows(rows)
+        self._update_total()
         self.items_changed.emit()
     
     def _clear_all(self):
@@ -818,8 +1401,9 @@ class EquipmentPlannerSubTab(QWidget):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             if reply == QMessageBox.StandardButton.Yes:
-                self.parent_tab.equipment_items.clear()
-                self._refresh_table()
+                self.model.clear()
+                self.parent_tab._invalidate_totals()
+                self._update_total()
                 self.items_changed.emit()
 
 
@@ -828,10 +1412,34 @@ class FacilityPlannerSubTab(QWidget):
     
     setups_changed = pyqtSignal()
     
+    # Setup widgets are created in batches of this size as the list is scrolled
+    SETUP_BATCH = 10
+    
     def __init__(self, parent_tab):
         super().__init__()
         self.parent_tab = parent_tab
+        
+        # Coalesce bursts of setup edits into one summary pass + setups_changed
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.setInterval(50)
+        self._summary_timer.timeout.connect(self._do_update_summary)
+        # Set when the summary bar was skipped while hidden (see showEvent)
+        self._summary_stale = False
+        
+        # ids of setups added here whose widget is not built yet (see _add_setup)
+        self._new_setup_ids = set()
+        # While set, the scroll bar is kept at the end so batches keep coming
+        self._follow_end = False
+        
         self._setup_ui()
+        self._create_setup_widgets()
+    
+    def showEvent(self, event):
+        """Catch up on summary updates skipped while the tab was hidden."""
+        super().showEvent(event)
+        if self._summary_stale:
+            self._do_update_summary()
     
     def _setup_ui(self):
         """Set up the facility planner interface."""
@@ -853,6 +1461,9 @@ class FacilityPlannerSubTab(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._scroll_bar = scroll.verticalScrollBar()
+        self._scroll_bar.valueChanged.connect(self._maybe_create_more)
+        self._scroll_bar.rangeChanged.connect(self._maybe_create_more)
         
         self.setups_container = QWidget()
         self.setups_layout = QVBoxLayout(self.setups_container)
@@ -879,12 +1490,12 @@ class FacilityPlannerSubTab(QWidget):
         summary_layout.addStretch()
         
         self.power_summary_label = QLabel("⚡ 0 kW required / 0 kW capacity")
-        self.power_summary_label.setFont(QFont("", 10, QFont.Weight.Bold))
+        self.power_summary_label.setFont(_bold_font(10))
         summary_layout.addWidget(self.power_summary_label)
         
         self.grand_total_label = QLabel("Total: $0")
-        self.grand_total_label.setFont(QFont("", 12, QFont.Weight.Bold))
-        self.grand_total_label.setStyleSheet("color: #0066cc;")
+        self.grand_total_label.setFont(_bold_font(12))
+        self.grand_total_label.setStyleSheet(_TOTAL_STYLE)
         summary_layout.addWidget(self.grand_total_label)
         
         layout.addWidget(summary_frame)
@@ -893,92 +1504,214 @@ class FacilityPlannerSubTab(QWidget):
         """Add a new power setup group."""
         # Create default setup
         if setup_data is None:
-            setup_num = len(self.parent_tab.power_setups) + 1
-            setup_data = {
-                "name": f"Power Setup {setup_num}",
-                "priority": "MEDIUM",
-                "include": True,
-                "buildings": [],
-                "power_source": None,
-                "power_cost": 0,
-                "power_capacity": 0,
-                "distribution_cost": 0,
-                "total_cost": 0,
-            }
+            setup_data = _new_setup(len(self.parent_tab.power_setups))
         
-        self.parent_tab.power_setups.append(setup_data)
+        setups = self.parent_tab.power_setups
+        setups.append(setup_data)
+        self.parent_tab._mark_dirty(setup_data)
+        self._new_setup_ids.add(id(setup_data))
         
-        # Create widget
-        widget = PowerSetupWidget(self, setup_data, len(self.parent_tab.power_setups) - 1)
-        widget.changed.connect(self._on_setup_changed)
-        widget.delete_requested.connect(self._delete_setup)
-        self.setups_layout.addWidget(widget)
+        if self.setups_layout.count() == len(setups) - 1:
+            self._create_setup_widgets(1)
+        else:
+            # Widgets cover a prefix, so earlier setups need theirs first:
+            # follow the scroll bar to the end and let _maybe_create_more
+            # build them one batch per layout pass
+            self._follow_end = True
+            self._maybe_create_more()
         
         self._update_summary()
-        self.setups_changed.emit()
+    
+    def reload(self):
+        """Rebuild the setup widgets after ``power_setups`` was replaced."""
+        while self.setups_layout.count():
+            widget = self.setups_layout.takeAt(0).widget()
+            if widget:
+                widget.hide()
+                widget.deleteLater()
+        self._new_setup_ids.clear()
+        self._follow_end = False
+        self._create_setup_widgets()
+        self._update_summary()
+    
+    def _create_setup_widgets(self, count=None):
+        """Create widgets for the next ``count`` setups that have none yet.
+        
+        Widgets always cover a prefix of ``power_setups``, so the layout
+        position of a widget is also its setup index.
+        """
+        setups = self.parent_tab.power_setups
+        start = self.setups_layout.count()
+        end = min(len(setups), start + (count or self.SETUP_BATCH))
+        for index in range(start, end):
+            is_new = id(setups[index]) in self._new_setup_ids
+            self._new_setup_ids.discard(id(setups[index]))
+            widget = PowerSetupWidget(self, setups[index], index, is_new)
+            widget.changed.connect(self._on_setup_changed)
+            widget.delete_requested.connect(self._delete_setup)
+            self.setups_layout.addWidget(widget)
+    
+    def _maybe_create_more(self, *args):
+        """Add the next batch of setup widgets once the list is scrolled near its end."""
+        if self.setups_layout.count() >= len(self.parent_tab.power_setups):
+            self._follow_end = False
+            return
+        bar = self._scroll_bar
+        if self._follow_end and bar.value() < bar.maximum():
+            # The last batch grew the range; jumping to the end re-enters here
+            bar.setValue(bar.maximum())
+            return
+        if bar.value() >= bar.maximum() - bar.pageStep():
+            self._create_setup_widgets()
     
     def _on_setup_changed(self):
-        """Handle setup changes."""
+        """Handle setup changes (only PowerSetupWidget.changed is connected here)."""
+        self.parent_tab._mark_dirty(self.sender().setup_data)
         self._update_summary()
-        self.setups_changed.emit()
     
     def _delete_setup(self, index):
         """Delete a power setup."""
         if 0 <= index < len(self.parent_tab.power_setups):
+            self.parent_tab._forget(self.parent_tab.power_setups[index])
             del self.parent_tab.power_setups[index]
             
-            # Remove widget
-            item = self.setups_layout.itemAt(index)
+            # Remove widget (takeAt detaches it now rather than when
+            # deleteLater runs, so the reindex below sees the final layout)
+            item = self.setups_layout.takeAt(index)
             if item:
                 widget = item.widget()
                 if widget:
+                    widget.hide()
                     widget.deleteLater()
             
-            # Reindex remaining widgets
-            for i in range(self.setups_layout.count()):
+            # Reindex the widgets that followed the removed one
+            for i in range(index, self.setups_layout.count()):
                 item = self.setups_layout.itemAt(i)
                 if item and item.widget():
                     item.widget().index = i
             
             self._update_summary()
-            self.setups_changed.emit()
     
     def _update_summary(self):
-        """Update the summary bar."""
-        total_buildings = 0
-        total_power_equip = 0
-        total_distribution = 0
-        total_required = 0
-        total_capacity = 0
-        
-        for setup in self.parent_tab.power_setups:
-            # Skip non-dict entries
-            if not isinstance(setup, dict):
-                continue
-            if not setup.get("include", True):
-                continue
-            
-            # Buildings cost and power
-            for bld in setup.get("buildings", []):
-                if isinstance(bld, dict):
-                    total_buildings += bld.get("price", 0) * bld.get("quantity", 1)
-                    total_required += bld.get("power_kw", 0) * bld.get("quantity", 1)
-            
-            total_power_equip += setup.get("power_cost", 0)
-            total_capacity += setup.get("power_capacity", 0)
-            total_distribution += setup.get("distribution_cost", 0)
-            # Add distribution power (from power inputs and conveyors)
-            total_required += setup.get("distribution_power", 0)
+        """Schedule a summary update (restarts a pending one)."""
+        self._summary_timer.start()
+    
+    def _do_update_summary(self):
+        """Update the summary bar and notify the parent tab.
+        
+        While hidden, only setups_changed is emitted (the overview still needs
+        it); the summary labels are refreshed on the next show.
+        """
+        if not self.isVisible():
+            self._summary_stale = True
+            self.setups_changed.emit()
+            return
+        self._summary_stale = False
+        
+        # Same running per-setup totals the overview uses (only dirty setups
+        # are re-summed), instead of walking every setup's buildings here
+        (_, total_buildings, total_power_equip,
+         total_required, total_distribution, total_capacity) = self.parent_tab._current_totals()
         
         grand_total = total_buildings + total_power_equip + total_distribution
         
-        self.total_buildings_label.setText(f"Buildings: ${total_buildings:,.0f}")
-        self.total_power_equip_label.setText(f"Power Equipment: ${total_power_equip:,.0f}")
-        self.total_distribution_label.setText(f"Distribution: ${total_distribution:,.0f}")
-        self.power_summary_label.setText(
-            f"⚡ {total_required:,.0f} kW required / {total_capacity:,.0f} kW capacity"
+        _set_text(self.total_buildings_label, "Buildings: " + _fmt_usd(total_buildings))
+        _set_text(self.total_power_equip_label, "Power Equipment: " + _fmt_usd(total_power_equip))
+        _set_text(self.total_distribution_label, "Distribution: " + _fmt_usd(total_distribution))
+        _set_text(
+            self.power_summary_label,
+            f"⚡ {_fmt_kw(total_required)} required / {_fmt_kw(total_capacity)} capacity"
         )
-        self.grand_total_label.setText(f"Total: ${grand_total:,.0f}")
+        _set_text(self.grand_total_label, "Total: " + _fmt_usd(grand_total))
+        self.setups_changed.emit()
+
+
+class SetupBuildingsModel(QAbstractTableModel):
+    """Table model over one power setup's ``buildings`` list.
+    
+    The last column shows a "×" remove marker; clicks on it are handled by
+    DeleteColumnDelegate.
+    """
+    
+    HEADERS = ["Name", "Power", "Price", "Qty", ""]
+    COL_DELETE = 4
+    
+    def __init__(self, setup_data, parent=None):
+        super().__init__(parent)
+        self.setup_data = setup_data
+    
+    @property
+    def _buildings(self):
+        return self.setup_data["buildings"]
+    
+    def append_building(self, building):
+        """Append a building and return its row."""
+        row = len(self._buildings)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._buildings.append(building)
+        self.endInsertRows()
+        return row
+    
+    def remove_row(self, row):
+        """Remove the building at ``row``."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._buildings[row]
+        self.endRemoveRows()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._buildings)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        col = index.column()
+        if col == self.COL_DELETE:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return "×"
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+            return None
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        
+        bld = self._buildings[index.row()]
+        qty = bld.get("quantity", 1)
+        if col == 0:
+            return bld.get("name", "")
+        if col == 1:
+            return f"{bld.get('power_kw', 0) * qty} kW"
+        if col == 2:
+            return f"${bld.get('price', 0) * qty:,}"
+        if col == 3:
+            return str(qty)
+        return None
+
+
+class DeleteColumnDelegate(QStyledItemDelegate):
+    """Turns a left click in its column into a ``delete_clicked(row)`` signal.
+    
+    Stands in for a QPushButton per row: the model paints the "×" text, so a
+    table with many rows carries no embedded widgets.
+    """
+    
+    delete_clicked = pyqtSignal(int)
+    
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            self.delete_clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 class PowerSetupWidget(QFrame):
@@ -987,28 +1720,47 @@ class PowerSetupWidget(QFrame):
     changed = pyqtSignal()
     delete_requested = pyqtSignal(int)
     
-    def __init__(self, parent_subtab, setup_data, index):
+    def __init__(self, parent_subtab, setup_data, index, is_new=False):
         super().__init__()
         self.parent_subtab = parent_subtab
-        # Ensure setup_data is a dict
-        if not isinstance(setup_data, dict):
-            setup_data = {
-                "name": f"Power Setup {index + 1}",
-                "priority": "MEDIUM",
-                "include": True,
-                "buildings": [],
-                "power_source": None,
-                "power_cost": 0,
-                "power_capacity": 0,
-                "distribution_cost": 0,
-                "total_cost": 0,
-            }
+        # Always a normalized dict (see BudgetPlannerTab.power_setups / _new_setup)
         self.setup_data = setup_data
         self.index = index
+        # Only a setup just added in the planner has its figures computed from
+        # the controls; a restored one starts with blank controls, so its saved
+        # figures are shown until it is edited rather than recomputed to zero
+        self._is_new = is_new
         
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
+        self._combos_populated = False
         self._setup_ui()
-        self._refresh()
+        # The catalog combos stay empty until the first show (see showEvent);
+        # until then display the setup's stored figures
+        self._cache_combo_data()
+        self._recompute_buildings()
+        self._show_stored_totals()
+    
+    def showEvent(self, event):
+        """Fill the catalog combos the first time the widget is shown."""
+        super().showEvent(event)
+        if self._combos_populated:
+            return
+        self._combos_populated = True
+        self._populate_generators()
+        self._populate_power_inputs()
+        self._populate_conveyors()
+        self._populate_pylons()
+        if self._is_new:
+            self._refresh()
+            # setup_data totals were just rewritten; let the running
+            # subtotals and summary pick them up
+            self.changed.emit()
+    
+    def _show_stored_totals(self):
+        """Fill the header and distribution labels from the saved setup figures."""
+        _set_text(self.power_label, f"⚡ {self.setup_data.get('power_required', 0):,} kW")
+        _set_text(self.cost_label, f"${self.setup_data.get('total_cost', 0):,}")
+        _set_text(self.dist_cost_label, f"${self.setup_data.get('distribution_cost', 0):,}")
     
     def _setup_ui(self):
         """Set up the widget interface."""
@@ -1026,6 +1778,10 @@ class PowerSetupWidget(QFrame):
         self.name_edit = QLineEdit(self.setup_data.get("name", ""))
         self.name_edit.setPlaceholderText("Setup Name")
         self.name_edit.textChanged.connect(self._on_name_changed)
+        self._name_timer = QTimer(self)
+        self._name_timer.setSingleShot(True)
+        self._name_timer.setInterval(300)
+        self._name_timer.timeout.connect(self.changed.emit)
         self.name_edit.setMaximumWidth(200)
         header.addWidget(self.name_edit)
         
@@ -1039,17 +1795,17 @@ class PowerSetupWidget(QFrame):
         header.addStretch()
         
         self.power_label = QLabel("⚡ 0 kW")
-        self.power_label.setFont(QFont("", 10, QFont.Weight.Bold))
+        self.power_label.setFont(_bold_font(10))
         header.addWidget(self.power_label)
         
         self.cost_label = QLabel("$0")
-        self.cost_label.setFont(QFont("", 10, QFont.Weight.Bold))
-        self.cost_label.setStyleSheet("color: #0066cc;")
+        self.cost_label.setFont(_bold_font(10))
+        self.cost_label.setStyleSheet(_TOTAL_STYLE)
         header.addWidget(self.cost_label)
         
         self.delete_btn = QPushButton("🗑️")
         self.delete_btn.setMaximumWidth(30)
-        self.delete_btn.clicked.connect(lambda: self.delete_requested.emit(self.index))
+        self.delete_btn.clicked.connect(self._on_delete_clicked)
         header.addWidget(self.delete_btn)
         
         layout.addLayout(header)
@@ -1067,13 +1823,20 @@ class PowerSetupWidget(QFrame):
         layout.addLayout(buildings_header)
         
         # Buildings table
-        self.buildings_table = QTableWidget()
-        self.buildings_table.setColumnCount(5)
-        self.buildings_table.setHorizontalHeaderLabels(["Name", "Power", "Price", "Qty", ""])
+        self.buildings_model = SetupBuildingsModel(self.setup_data, self)
+        self.buildings_table = QTableView()
+        self.buildings_table.setModel(self.buildings_model)
         self.buildings_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.buildings_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
         self.buildings_table.setColumnWidth(4, 30)
         self.buildings_table.setMaximumHeight(120)
+        self.buildings_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.buildings_table.verticalHeader().setDefaultSectionSize(22)
+        self._delete_delegate = DeleteColumnDelegate(self.buildings_table)
+        self._delete_delegate.delete_clicked.connect(self._remove_building)
+        self.buildings_table.setItemDelegateForColumn(
+            SetupBuildingsModel.COL_DELETE, self._delete_delegate
+        )
         layout.addWidget(self.buildings_table)
         
         # === Power Source Section ===
@@ -1082,7 +1845,6 @@ class PowerSetupWidget(QFrame):
         
         power_layout.addWidget(QLabel("Generator:"))
         self.generator_combo = QComboBox()
-        self._populate_generators()
         self.generator_combo.currentIndexChanged.connect(self._on_generator_changed)
         power_layout.addWidget(self.generator_combo)
         
@@ -1107,7 +1869,6 @@ class PowerSetupWidget(QFrame):
         power_input_row = QHBoxLayout()
         power_input_row.addWidget(QLabel("Speed Booster:"))
         self.power_input_combo = QComboBox()
-        self._populate_power_inputs()
         self.power_input_combo.currentIndexChanged.connect(self._on_distribution_changed)
         self.power_input_combo.setMinimumWidth(280)
         power_input_row.addWidget(self.power_input_combo)
@@ -1128,7 +1889,6 @@ class PowerSetupWidget(QFrame):
         conveyor_row = QHBoxLayout()
         conveyor_row.addWidget(QLabel("Conveyors:"))
         self.conveyor_combo = QComboBox()
-        self._populate_conveyors()
         self.conveyor_combo.currentIndexChanged.connect(self._on_distribution_changed)
         self.conveyor_combo.setMinimumWidth(280)
         conveyor_row.addWidget(self.conveyor_combo)
@@ -1149,7 +1909,6 @@ class PowerSetupWidget(QFrame):
         pylon_row = QHBoxLayout()
         pylon_row.addWidget(QLabel("Pylons:"))
         self.pylon_combo = QComboBox()
-        self._populate_pylons()
         self.pylon_combo.currentIndexChanged.connect(self._on_distribution_changed)
         self.pylon_combo.setMinimumWidth(200)
         pylon_row.addWidget(self.pylon_combo)
@@ -1175,137 +1934,121 @@ class PowerSetupWidget(QFrame):
         
         layout.addWidget(dist_group)
     
+    def _set_catalog_model(self, combo, kind):
+        """Point a catalog combo at the shared model without firing its handlers.
+        
+        The current row is kept, so this is safe after the combo's
+        currentIndexChanged handler has been connected.
+        """
+        combo.blockSignals(True)
+        current = combo.currentIndex()
+        combo.setModel(self.parent_subtab.parent_tab.catalog_model(kind))
+        combo.setCurrentIndex(max(current, 0))
+        combo.blockSignals(False)
+    
     def _populate_generators(self):
         """Populate generator dropdown."""
-        self.generator_combo.clear()
-        self.generator_combo.addItem("None", None)
-        
-        for gen in self.parent_subtab.parent_tab._generators:
-            power = gen.get("power_generated_kw", 0)
-            price = gen.get("price", 0)
-            name = gen.get("name", "Unknown")
-            cost_per_kw = price / power if power > 0 else 0
-            self.generator_combo.addItem(
-                f"{name} ({power:,} kW) - ${price:,} (${cost_per_kw:.2f}/kW)",
-                gen
-            )
+        self._set_catalog_model(self.generator_combo, "generators")
     
     def _populate_power_inputs(self):
         """Populate power input (speed booster) dropdown."""
-        self.power_input_combo.clear()
-        self.power_input_combo.addItem("None", None)
-        
-        for pi in self.parent_subtab.parent_tab._power_inputs:
-            power = pi.get("power_kw", 0)
-            price = pi.get("price", 0)
-            name = pi.get("name", "Unknown")
-            self.power_input_combo.addItem(f"{name} ({power} kW) - ${price:,}", pi)
+        self._set_catalog_model(self.power_input_combo, "power_inputs")
     
     def _populate_conveyors(self):
         """Populate conveyor dropdown."""
-        self.conveyor_combo.clear()
-        self.conveyor_combo.addItem("None", None)
-        
-        for conv in self.parent_subtab.parent_tab._conveyors:
-            power = conv.get("power_consumption_kw", 0)
-            price = conv.get("price", 0)
-            name = conv.get("name", "Unknown")
-            self.conveyor_combo.addItem(f"{name} ({power} kW) - ${price:,}", conv)
+        self._set_catalog_model(self.conveyor_combo, "conveyors")
     
     def _populate_pylons(self):
         """Populate pylon dropdown."""
-        self.pylon_combo.clear()
-        self.pylon_combo.addItem("None", None)
-        
-        for pylon in self.parent_subtab.parent_tab._pylons:
-            capacity = pylon.get("max_capacity_kw", 0)
-            price = pylon.get("price", 0)
-            name = pylon.get("name", "Unknown")
-            self.pylon_combo.addItem(f"{name} ({capacity:,} kW) - ${price:,}", pylon)
+        self._set_catalog_model(self.pylon_combo, "pylons")
     
     def _add_building(self):
         """Add a building to this setup."""
-        dialog = AddBuildingDialog(self, self.parent_subtab.parent_tab._buildings)
+        dialog = AddBuildingDialog(self, self.parent_subtab.parent_tab.catalog_model("buildings"))
         if dialog.exec() == QDialog.DialogCode.Accepted:
             building = dialog.get_building()
             if building:
-                self.setup_data["buildings"].append(building)
-                self._refresh()
+                self.buildings_model.append_building(building)
+                self._recompute_buildings()
+                self._recompute_totals()
                 self.changed.emit()
     
     def _refresh(self):
         """Refresh the widget display."""
-        # Refresh buildings table
-        buildings = self.setup_data.get("buildings", [])
-        self.buildings_table.setRowCount(len(buildings))
-        
+        self._cache_combo_data()
+        self._recompute_buildings()
+        self._recompute_totals()
+    
+    def _cache_combo_data(self):
+        """Remember the catalog entries currently selected in the combos."""
+        self._gen_data = self.generator_combo.currentData()
+        self._pi_data = self.power_input_combo.currentData()
+        self._conv_data = self.conveyor_combo.currentData()
+        self._pylon_data = self.pylon_combo.currentData()
+    
+    def _recompute_buildings(self):
+        """Re-sum the buildings list (only needed after a building add/remove)."""
+        # The table itself reads setup_data through buildings_model
         total_power = 0
         total_cost = 0
         
-        for row, bld in enumerate(buildings):
-            self.buildings_table.setItem(row, 0, QTableWidgetItem(bld.get("name", "")))
-            
-            power = bld.get("power_kw", 0)
+        for bld in self.setup_data.get("buildings", []):
             qty = bld.get("quantity", 1)
-            total_power += power * qty
-            self.buildings_table.setItem(row, 1, QTableWidgetItem(f"{power * qty} kW"))
-            
-            price = bld.get("price", 0)
-            total_cost += price * qty
-            self.buildings_table.setItem(row, 2, QTableWidgetItem(f"${price * qty:,}"))
-            
-            self.buildings_table.setItem(row, 3, QTableWidgetItem(str(qty)))
-            
-            # Delete button
-            del_btn = QPushButton("×")
-            del_btn.setMaximumWidth(25)
-            del_btn.clicked.connect(lambda checked, r=row: self._remove_building(r))
-            self.buildings_table.setCellWidget(row, 4, del_btn)
+            total_power += bld.get("power_kw", 0) * qty
+            total_cost += bld.get("price", 0) * qty
+        
+        self._buildings_power = total_power
+        self._buildings_cost = total_cost
+    
+    def _recompute_totals(self):
+        """Recompute power/distribution costs and labels from cached selections."""
+        total_power = self._buildings_power
+        total_cost = self._buildings_cost
         
         # Update power cost
-        gen_data = self.generator_combo.currentData()
+        gen_data = self._gen_data
         gen_qty = self.generator_qty.value()
         if gen_data and gen_qty > 0:
             power_cost = gen_data.get("price", 0) * gen_qty
             power_capacity = gen_data.get("power_generated_kw", 0) * gen_qty
             self.setup_data["power_cost"] = power_cost
             self.setup_data["power_capacity"] = power_capacity
-            self.generator_info.setText(f"= {power_capacity:,} kW, ${power_cost:,}")
+            _set_text(self.generator_info, f"= {power_capacity:,} kW, ${power_cost:,}")
         else:
             self.setup_data["power_cost"] = 0
             self.setup_data["power_capacity"] = 0
-            self.generator_info.setText("")
+            _set_text(self.generator_info, "")
         
         # Update distribution cost and power
         dist_cost = 0
         dist_power = 0
         
         # Power Input (Speed Booster)
-        pi_data = self.power_input_combo.currentData()
+        pi_data = self._pi_data
         pi_qty = self.power_input_qty.value()
         if pi_data and pi_qty > 0:
             pi_cost = pi_data.get("price", 0) * pi_qty
             pi_power = pi_data.get("power_kw", 0) * pi_qty
             dist_cost += pi_cost
             dist_power += pi_power
-            self.power_input_info.setText(f"= {pi_power:,} kW, ${pi_cost:,}")
+            _set_text(self.power_input_info, f"= {pi_power:,} kW, ${pi_cost:,}")
         else:
-            self.power_input_info.setText("")
+            _set_text(self.power_input_info, "")
         
         # Conveyors
-        conv_data = self.conveyor_combo.currentData()
+        conv_data = self._conv_data
         conv_qty = self.conveyor_qty.value()
         if conv_data and conv_qty > 0:
             conv_cost = conv_data.get("price", 0) * conv_qty
             conv_power = conv_data.get("power_consumption_kw", 0) * conv_qty
             dist_cost += conv_cost
             dist_power += conv_power
-            self.conveyor_info.setText(f"= {conv_power:,} kW, ${conv_cost:,}")
+            _set_text(self.conveyor_info, f"= {conv_power:,} kW, ${conv_cost:,}")
         else:
-            self.conveyor_info.setText("")
+            _set_text(self.conveyor_info, "")
         
         # Pylons
-        pylon_data = self.pylon_combo.currentData()
+        pylon_data = self._pylon_data
         pylon_qty = self.pylon_qty.value()
         if pylon_data and pylon_qty > 0:
             dist_cost += pylon_data.get("price", 0) * pylon_qty
@@ -1316,55 +2059,69 @@ class PowerSetupWidget(QFrame):
         
         self.setup_data["distribution_cost"] = dist_cost
         self.setup_data["distribution_power"] = dist_power
-        self.dist_cost_label.setText(f"${dist_cost:,}")
+        _set_text(self.dist_cost_label, f"${dist_cost:,}")
         
         # Add distribution power to total power required
         total_power += dist_power
         
         # Update totals
         total_with_power = total_cost + self.setup_data["power_cost"] + dist_cost
+        self.setup_data["facility_subtotal"] = total_cost
+        self.setup_data["power_required"] = total_power
         self.setup_data["total_cost"] = total_with_power
         
-        self.power_label.setText(f"⚡ {total_power:,} kW")
-        self.cost_label.setText(f"${total_with_power:,}")
+        _set_text(self.power_label, f"⚡ {total_power:,} kW")
+        _set_text(self.cost_label, f"${total_with_power:,}")
     
     def _remove_building(self, row):
         """Remove a building from this setup."""
         if row < len(self.setup_data["buildings"]):
-            del self.setup_data["buildings"][row]
-            self._refresh()
+            self.buildings_model.remove_row(row)
+            self._recompute_buildings()
+            self._recompute_totals()
             self.changed.emit()
     
+    def _on_delete_clicked(self):
+        # Read self.index at click time; it changes when earlier setups are deleted
+        self.delete_requested.emit(self.index)
+    
     def _on_include_changed(self, state):
         self.setup_data["include"] = (state == Qt.CheckState.Checked.value)
         self.changed.emit()
     
     def _on_name_changed(self, text):
         self.setup_data["name"] = text
+        # Report once typing pauses so the priority queue picks up the name
+        self._name_timer.start()
     
     def _on_priority_changed(self, text):
         self.setup_data["priority"] = text
         self.changed.emit()
     
     def _on_generator_changed(self, index):
-        self._refresh()
+        self._gen_data = self.generator_combo.currentData()
+        self._recompute_totals()
         self.changed.emit()
     
     def _on_generator_qty_changed(self, value):
-        self._refresh()
+        self._recompute_totals()
         self.changed.emit()
     
     def _on_distribution_changed(self):
-        self._refresh()
+        # Shared by the distribution combos and spinboxes
+        self._pi_data = self.power_input_combo.currentData()
+        self._conv_data = self.conveyor_combo.currentData()
+        self._pylon_data = self.pylon_combo.currentData()
+        self._recompute_totals()
         self.changed.emit()
 
 
 class AddBuildingDialog(QDialog):
     """Dialog for adding a building to a power setup."""
     
-    def __init__(self, parent, buildings):
+    def __init__(self, parent, building_model):
         super().__init__(parent)
-        self.buildings = buildings
+        self.building_model = building_model
         self.setWindowTitle("Add Building")
         self.setMinimumWidth(400)
         self._setup_ui()
@@ -1376,11 +2133,7 @@ class AddBuildingDialog(QDialog):
         
         # Building dropdown
         self.building_combo = QComboBox()
-        for bld in self.buildings:
-            name = bld.get("name", "Unknown")
-            power = bld.get("power_kw", 0)
-            price = bld.get("price", 0)
-            self.building_combo.addItem(f"{name} ({power} kW, ${price:,})", bld)
+        self.building_combo.setModel(self.building_model)
         form.addRow("Building:", self.building_combo)
         
         # Quantity
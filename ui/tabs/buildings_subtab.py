@@ -4,12 +4,15 @@ Buildings Sub-Tab - Factory production buildings with specs and I/O
 Displays all factory buildings used for processing materials.
 """
 
+import sys
+from collections import Counter
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QLineEdit,
     QComboBox,
@@ -21,7 +24,14 @@ from PyQt6.QtWidgets import (
     QSplitter,
     QTextEdit,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QTimer,
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+)
 from PyQt6.QtGui import QColor
 
 
@@ -172,16 +182,230 @@ BUILDING_DATA = [
      "notes": "Coil → Sheet"},
 ]
 
+def _freeze_building_strings():
+    """Store inputs/outputs as tuples and intern the strings repeated across
+    buildings ("Any Material", category names, ...) so they are shared."""
+    for b in BUILDING_DATA:
+        b["name"] = sys.intern(b["name"])
+        b["category"] = sys.intern(b["category"])
+        b["inputs"] = tuple(sys.intern(s) for s in b.get("inputs", ()))
+        b["outputs"] = tuple(sys.intern(s) for s in b.get("outputs", ()))
+
+
+_freeze_building_strings()
+
+# Lowercased search fields, parallel to BUILDING_DATA (built once at import)
+_NAMES_LC = tuple(b["name"].lower() for b in BUILDING_DATA)
+_CATS_LC = tuple(b["category"].lower() for b in BUILDING_DATA)
+_BY_ART_NR = {b["art_nr"]: b for b in BUILDING_DATA}
+# Stats panel figures (BUILDING_DATA is static)
+_CATEGORY_COUNTS = Counter(b["category"] for b in BUILDING_DATA)
+_TOTAL_POWER = sum(b["power_kw"] for b in BUILDING_DATA)
+
+
+def _build_trigram_index():
+    """Map each 3-char substring of name/category to the buildings containing it."""
+    index = {}
+    for i, (name_lc, cat_lc) in enumerate(zip(_NAMES_LC, _CATS_LC)):
+        for text in (name_lc, cat_lc):
+            for k in range(len(text) - 2):
+                index.setdefault(text[k:k + 3], set()).add(i)
+    return index
+
+
+# Prefilter for searches of 3+ chars: a building can only match if it has
+# every trigram of the query (substring match is still confirmed after)
+_TRIGRAMS = _build_trigram_index()
+# Table cell text per building, parallel to BUILDING_DATA (formatted once)
+_DISPLAY_TEXT = tuple(
+    (
+        str(b["art_nr"]),
+        b["name"],
+        b["category"],
+        f"{b['power_kw']:.0f}" if b["power_kw"] > 0 else "0",
+        f"{b['length_m']:.0f}m × {b['height_m']:.0f}m",
+        f"${b['price']:,.0f}",
+    )
+    for b in BUILDING_DATA
+)
+
+
+# Panel stylesheets, installed once as each QTextDocument's default
+# stylesheet so the per-update HTML carries only body markup
+_STATS_CSS = """
+    body { font-family: sans-serif; font-size: 11px; }
+    h3 { margin: 5px 0; color: #1976d2; }
+    .stat { margin: 2px 0; }
+"""
+_DETAILS_CSS = """
+    body { font-family: sans-serif; font-size: 12px; }
+    h3 { margin: 5px 0; color: #1976d2; }
+    .label { color: #666; }
+    .value { font-weight: bold; }
+    .section { margin-top: 10px; }
+    .io { background: #f5f5f5; padding: 5px; margin: 3px 0; border-radius: 3px; }
+    .input { color: #c62828; }
+    .output { color: #2e7d32; }
+"""
+
+
+@lru_cache(maxsize=1)
+def _stats_html():
+    """Category summary HTML for the stats panel (BUILDING_DATA is static)."""
+    parts = ["""
+    <h3>🏭 Building Categories</h3>
+    """]
+    
+    for cat, count in sorted(_CATEGORY_COUNTS.items()):
+        parts.append(f'<div class="stat">{cat}: {count}</div>')
+    
+    parts.append(f'<div class="stat"><b>Total: {len(BUILDING_DATA)}</b></div>')
+    parts.append(f'<div class="stat">Total Power: {_TOTAL_POWER:,.0f} kW</div>')
+    return "".join(parts)
+
+
+@lru_cache(maxsize=64)
+def _details_html(art_nr):
+    """Details/I-O HTML for the building with ``art_nr``."""
+    building = _BY_ART_NR[art_nr]
+    
+    parts = [f"""
+    <h3>{building["name"]}</h3>
+    <p><span class="label">Art.Nr:</span> <span class="value">{building["art_nr"]}</span></p>
+    <p><span class="label">Category:</span> <span class="value">{building["category"]}</span></p>
+    <p><span class="label">Price:</span> <span class="value">${building["price"]:,.0f}</span></p>
+    <p><span class="label">Power:</span> <span class="value" style="color:{'#c62828' if building['power_kw'] > 0 else '#2e7d32'}">{building["power_kw"]} kW</span></p>
+    <p><span class="label">Dimensions:</span> <span class="value">{building["length_m"]}m × {building["height_m"]}m</span></p>
+    
+    <div class="section">
+    <h3>⬇️ Inputs</h3>
+    """]
+    
+    for inp in building["inputs"]:
+        parts.append(f'<div class="io input">• {inp}</div>')
+    
+    parts.append("""
+    <h3>⬆️ Outputs</h3>
+    """)
+    
+    for out in building["outputs"]:
+        parts.append(f'<div class="io output">• {out}</div>')
+    
+    if building.get("notes"):
+        parts.append(f'<div class="section"><p><span class="label">Notes:</span> {building["notes"]}</p></div>')
+    
+    return "".join(parts)
+
+
+class BuildingsTableModel(QAbstractTableModel):
+    """Table model over a subset of ``buildings``, given as a list of indices.
+    
+    ``buildings`` must be in BUILDING_DATA order; cell text comes from the
+    preformatted _DISPLAY_TEXT.
+    
+    UserRole carries a raw sort key per column so sorting is numeric where
+    the displayed text is formatted.
+    """
+    
+    HEADERS = ["Art.Nr", "Name", "Category", "Power (kW)", "Dimensions", "Price"]
+    
+    _ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+    _ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+    # Per-column text alignment (None = default)
+    _ALIGNMENTS = (_ALIGN_CENTER, None, None, _ALIGN_RIGHT, _ALIGN_CENTER, _ALIGN_RIGHT)
+    
+    # Power column colours, shared by every row
+    _FG_RED = QColor("#c62828")
+    _FG_GREEN = QColor("#2e7d32")  # No power draw
+    
+    def __init__(self, buildings, parent=None):
+        super().__init__(parent)
+        self._buildings = buildings
+        self._rows = []
+        # Building index -> {role: per-column values}; the data is static, so
+        # each row's cells are built once and every role is then a lookup
+        self._cells = {}
+    
+    def set_rows(self, indices):
+        """Show ``buildings[i]`` for each i in ``indices``.
+        
+        A change is a single model reset (one relayout and repaint of the
+        view); an unchanged row list emits nothing at all.
+        """
+        indices = list(indices)
+        if indices == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = indices
+        self.endResetModel()
+    
+    def building_at(self, row):
+        """Return the building shown at (source) ``row``."""
+        return self._buildings[self._rows[row]]
+    
+    def _row_cells(self, idx):
+        """All role values for building ``idx``, built on first use."""
+        cells = self._cells.get(idx)
+        if cells is None:
+            building = self._buildings[idx]
+            power = building["power_kw"]
+            cells = {
+                Qt.ItemDataRole.DisplayRole: _DISPLAY_TEXT[idx],
+                Qt.ItemDataRole.UserRole: (
+                    building["art_nr"],
+                    building["name"],
+                    building["category"],
+                    power,
+                    building["length_m"] * building["height_m"],
+                    building["price"],
+                ),
+                Qt.ItemDataRole.TextAlignmentRole: self._ALIGNMENTS,
+                Qt.ItemDataRole.ForegroundRole: (
+                    None, None, None,
+                    self._FG_RED if power > 0 else self._FG_GREEN,
+                    None, None,
+                ),
+            }
+            self._cells[idx] = cells
+        return cells
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        idx = self._rows[index.row()]
+        # Called per cell per role on every paint: skip the builder call on a hit
+        cells = self._cells.get(idx) or self._row_cells(idx)
+        values = cells.get(role)
+        if values is None:
+            return None
+        return values[index.column()]
+
 
 class BuildingsSubTab(QWidget):
     """Buildings sub-tab showing factory production buildings."""
     
     data_changed = pyqtSignal()
     
+    # Columns fitted to their contents (Name stretches)
+    _FIT_COLUMNS = (0, 2, 3, 4, 5)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.all_buildings = BUILDING_DATA.copy()
-        self.filtered_buildings = []
+        self._by_name = {b["name"]: b for b in self.all_buildings}
+        self.filtered_indices = []  # Indices into all_buildings, in table order
+        self._last_filter = None    # (search_text, category) behind filtered_indices
         
         self._setup_ui()
         self._load_data()
@@ -198,7 +422,12 @@ class BuildingsSubTab(QWidget):
         filter_layout.addWidget(QLabel("Search:"))
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search buildings...")
-        self.search_input.textChanged.connect(self._apply_filters)
+        # Refilter once typing pauses rather than on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self._apply_filters)
+        self.search_input.textChanged.connect(lambda _text: self._filter_timer.start())
         filter_layout.addWidget(self.search_input, stretch=2)
         
         filter_layout.addWidget(QLabel("Category:"))
@@ -228,21 +457,16 @@ class BuildingsSubTab(QWidget):
         splitter.setSizes([650, 350])
         layout.addWidget(splitter, stretch=1)  # stretch=1 ensures it takes remaining space
     
-    def _create_table(self) -> QTableWidget:
+    def _create_table(self) -> QTableView:
         """Create the building table."""
-        table = QTableWidget()
+        self.model = BuildingsTableModel(self.all_buildings, self)
+        # Header-click sorting happens in the proxy, on the model's raw UserRole keys
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(Qt.ItemDataRole.UserRole)
         
-        self.columns = [
-            "Art.Nr",
-            "Name",
-            "Category",
-            "Power (kW)",
-            "Dimensions",
-            "Price",
-        ]
-        
-        table.setColumnCount(len(self.columns))
-        table.setHorizontalHeaderLabels(self.columns)
+        table = QTableView()
+        table.setModel(self.proxy)
         
         table.setAlternatingRowColors(True)
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -251,10 +475,12 @@ class BuildingsSubTab(QWidget):
         
         header = table.horizontalHeader()
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Name
-        for i in [0, 2, 3, 4, 5]:
-            header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+        # The other columns are sized to contents once, in _load_data, rather
+        # than re-measured on every refilter
+        for i in self._FIT_COLUMNS:
+            header.setSectionResizeMode(i, QHeaderView.ResizeMode.Interactive)
         
-        table.itemSelectionChanged.connect(self._on_selection_changed)
+        table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         
         return table
     
@@ -270,6 +496,7 @@ class BuildingsSubTab(QWidget):
         
         self.stats_text = QTextEdit()
         self.stats_text.setReadOnly(True)
+        self.stats_text.document().setDefaultStyleSheet(_STATS_CSS)
         self.stats_text.setMaximumHeight(150)
         stats_layout.addWidget(self.stats_text)
         
@@ -281,6 +508,7 @@ class BuildingsSubTab(QWidget):
         
         self.details_text = QTextEdit()
         self.details_text.setReadOnly(True)
+        self.details_text.document().setDefaultStyleSheet(_DETAILS_CSS)
         details_layout.addWidget(self.details_text)
         
         layout.addWidget(details_group)
@@ -289,8 +517,15 @@ class BuildingsSubTab(QWidget):
     
     def _load_data(self):
         """Load buildings data."""
+        self._last_filter = None
+        
+        # Category -> indices into all_buildings ("All" covers every row)
+        self._by_category = {"All": list(range(len(self.all_buildings)))}
+        for i, b in enumerate(self.all_buildings):
+            self._by_category.setdefault(b["category"], []).append(i)
+        
         # Update category dropdown
-        categories = sorted(set(b["category"] for b in self.all_buildings))
+        categories = sorted(cat for cat in self._by_category if cat != "All")
         self.category_combo.blockSignals(True)
         self.category_combo.clear()
         self.category_combo.addItem("All")
@@ -298,159 +533,84 @@ class BuildingsSubTab(QWidget):
         self.category_combo.blockSignals(False)
         
         self._apply_filters()
-        self._update_stats()
+        # Every building is listed at this point and the data is static, so
+        # fitting now covers anything a later filter can show
+        for i in self._FIT_COLUMNS:
+            self.table.resizeColumnToContents(i)
+        # The stats panel is filled on first show (see showEvent)
+        self._stats_pending = True
+    
+    def showEvent(self, event):
+        """Fill the stats panel the first time the sub-tab is shown."""
+        super().showEvent(event)
+        if self._stats_pending:
+            self._stats_pending = False
+            self._update_stats()
     
     def _apply_filters(self):
         """Apply filters to building list."""
         search_text = self.search_input.text().lower().strip()
         category_filter = self.category_combo.currentText()
         
-        self.filtered_buildings = []
-        
-        for building in self.all_buildings:
-            # Search filter
-            if search_text:
-                if (search_text not in building["name"].lower() and 
-                    search_text not in building["category"].lower()):
-                    continue
-            
-            # Category filter
-            if category_filter != "All" and building["category"] != category_filter:
-                continue
-            
-            self.filtered_buildings.append(building)
-        
-        self._populate_table()
+        key = (search_text, category_filter)
+        previous = self._last_filter
+        if key == previous:
+            return
+        self._last_filter = key
+        
+        if (previous is not None and previous[1] == category_filter
+                and previous[0] and search_text.startswith(previous[0])):
+            # Typing extended the query: matches are a subset of the last result
+            candidates = self.filtered_indices
+        else:
+            # Category filter: start from that category's bucket
+            candidates = self._by_category.get(category_filter, [])
+        
+        # Search filter
+        if search_text:
+            if len(search_text) >= 3:
+                hits = None
+                for k in range(len(search_text) - 2):
+                    bucket = _TRIGRAMS.get(search_text[k:k + 3])
+                    if not bucket:
+                        hits = ()
+                        break
+                    hits = set(bucket) if hits is None else hits & bucket
+                candidates = [i for i in candidates if i in hits]
+            names_lc, cats_lc = _NAMES_LC, _CATS_LC  # Local lookups in the loop
+            self.filtered_indices = [
+                i for i in candidates
+                if search_text in names_lc[i] or search_text in cats_lc[i]
+            ]
+        else:
+            self.filtered_indices = list(candidates)
+        
+        self.model.set_rows(self.filtered_indices)
         self._update_count()
     
-    def _populate_table(self):
-        """Populate table with filtered buildings."""
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(len(self.filtered_buildings))
-        
-        for row, building in enumerate(self.filtered_buildings):
-            # Art.Nr
-            art_item = QTableWidgetItem(str(building["art_nr"]))
-            art_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 0, art_item)
-            
-            # Name
-            name_item = QTableWidgetItem(building["name"])
-            self.table.setItem(row, 1, name_item)
-            
-            # Category
-            cat_item = QTableWidgetItem(building["category"])
-            self.table.setItem(row, 2, cat_item)
-            
-            # Power
-            power = building["power_kw"]
-            if power > 0:
-                power_text = f"{power:.0f}"
-                power_item = QTableWidgetItem(power_text)
-                power_item.setForeground(QColor("#c62828"))
-            else:
-                power_item = QTableWidgetItem("0")
-                power_item.setForeground(QColor("#2e7d32"))  # Green for no power
-            power_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 3, power_item)
-            
-            # Dimensions
-            dim_text = f"{building['length_m']:.0f}m × {building['height_m']:.0f}m"
-            dim_item = QTableWidgetItem(dim_text)
-            dim_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 4, dim_item)
-            
-            # Price
-            price_item = QTableWidgetItem(f"${building['price']:,.0f}")
-            price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 5, price_item)
-        
-        self.table.setSortingEnabled(True)
-    
     def _update_count(self):
         """Update the building count label."""
-        self.count_label.setText(f"Buildings: {len(self.filtered_buildings)} / {len(self.all_buildings)}")
+        self.count_label.setText(f"Buildings: {len(self.filtered_indices)} / {len(self.all_buildings)}")
     
     def _update_stats(self):
         """Update summary statistics."""
-        # Count by category
-        categories = {}
-        total_power = 0
-        for b in self.all_buildings:
-            cat = b["category"]
-            categories[cat] = categories.get(cat, 0) + 1
-            total_power += b["power_kw"]
-        
-        html = """
-        <style>
-            body { font-family: sans-serif; font-size: 11px; }
-            h3 { margin: 5px 0; color: #1976d2; }
-            .stat { margin: 2px 0; }
-        </style>
-        <h3>🏭 Building Categories</h3>
-        """
-        
-        for cat, count in sorted(categories.items()):
-            html += f'<div class="stat">{cat}: {count}</div>'
-        
-        html += f'<div class="stat"><b>Total: {len(self.all_buildings)}</b></div>'
-        html += f'<div class="stat">Total Power: {total_power:,.0f} kW</div>'
-        
-        self.stats_text.setHtml(html)
+        self.stats_text.setHtml(_stats_html())
     
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, *args):
         """Handle table selection change."""
-        selected = self.table.selectedItems()
+        selected = self.table.selectionModel().selectedRows()
         if not selected:
             self.details_text.clear()
             return
         
-        row = selected[0].row()
-        if row < 0 or row >= len(self.filtered_buildings):
+        # Map through the sort proxy so sorted rows resolve to the right building
+        row = self.proxy.mapToSource(selected[0]).row()
+        if row < 0:
             return
         
-        building = self.filtered_buildings[row]
-        
-        html = f"""
-        <style>
-            body {{ font-family: sans-serif; font-size: 12px; }}
-            h3 {{ margin: 5px 0; color: #1976d2; }}
-            .label {{ color: #666; }}
-            .value {{ font-weight: bold; }}
-            .section {{ margin-top: 10px; }}
-            .io {{ background: #f5f5f5; padding: 5px; margin: 3px 0; border-radius: 3px; }}
-            .input {{ color: #c62828; }}
-            .output {{ color: #2e7d32; }}
-        </style>
-        <h3>{building["name"]}</h3>
-        <p><span class="label">Art.Nr:</span> <span class="value">{building["art_nr"]}</span></p>
-        <p><span class="label">Category:</span> <span class="value">{building["category"]}</span></p>
-        <p><span class="label">Price:</span> <span class="value">${building["price"]:,.0f}</span></p>
-        <p><span class="label">Power:</span> <span class="value" style="color:{'#c62828' if building['power_kw'] > 0 else '#2e7d32'}">{building["power_kw"]} kW</span></p>
-        <p><span class="label">Dimensions:</span> <span class="value">{building["length_m"]}m × {building["height_m"]}m</span></p>
-        
-        <div class="section">
-        <h3>⬇️ Inputs</h3>
-        """
-        
-        for inp in building.get("inputs", []):
-            html += f'<div class="io input">• {inp}</div>'
-        
-        html += """
-        <h3>⬆️ Outputs</h3>
-        """
-        
-        for out in building.get("outputs", []):
-            html += f'<div class="io output">• {out}</div>'
-        
-        if building.get("notes"):
-            html += f'<div class="section"><p><span class="label">Notes:</span> {building["notes"]}</p></div>'
-        
-        self.details_text.setHtml(html)
+        building = self.model.building_at(row)
+        self.details_text.setHtml(_details_html(building["art_nr"]))
     
     def get_building_by_name(self, name: str) -> dict:
         """Get building by name."""
-        for b in self.all_buildings:
-            if b["name"] == name:
-                return b
-        return None
+        return self._by_name.get(name)
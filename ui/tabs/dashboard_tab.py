@@ -1,15 +1,152 @@
 """
 Dashboard Tab - Main overview combining data from all tabs.
 """
+from typing import Optional
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel,
-    QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+    QPushButton, QTableWidget, QTableWidgetItem, QTableView, QHeaderView,
     QFrame, QProgressBar, QAbstractItemView, QScrollArea,
     QDateEdit, QTextEdit, QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QDate
+from PyQt6.QtCore import Qt, pyqtSignal, QDate, QAbstractTableModel, QModelIndex, QTimer
 from PyQt6.QtGui import QFont, QColor
 
+from config.settings import TAB_INDEX
+
+
+_ALIGN_RIGHT_V = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_COLOR_INCOME = QColor("#008800")
+_COLOR_EXPENSE = QColor("#CC0000")
+
+# Every dashboard style, set once on the tab. Widgets are picked out by
+# object name; looks that change at runtime key off the "state" property
+# (see _set_state). Oil states: ok / high = 75% used / warn = 90% used /
+# cap / disabled. Banner states: ok / warn / crit.
+_DASHBOARD_QSS = """
+    QFrame#status_frame[state="ok"] { background-color: #D5F5D5; }
+    QFrame#status_frame[state="warn"] { background-color: #FFF2CC; }
+    QFrame#status_frame[state="crit"] { background-color: #F8D6D6; }
+    
+    QFrame#card { border-radius: 5px; }
+    QFrame#card[tone="blue"] { background-color: #E8F4FD; }
+    QFrame#card[tone="green"] { background-color: #D5F5D5; }
+    QFrame#card[tone="yellow"] { background-color: #FFF2CC; }
+    QLabel#value_label { color: #1F4E79; }
+    QLabel#value_label[state="ok"] { color: #008800; }
+    QLabel#value_label[state="low"] { color: #CC0000; }
+    QLabel#subtitle_label, QLabel#oil_remaining_label { color: #666666; }
+    
+    QProgressBar#oil_progress {
+        border: 2px solid #1F4E79;
+        border-radius: 5px;
+        text-align: center;
+        font-weight: bold;
+    }
+    QProgressBar#oil_progress[state="warn"] { border-color: #CC8800; }
+    QProgressBar#oil_progress[state="cap"] { border-color: #CC0000; }
+    QProgressBar#oil_progress[state="disabled"] { border-color: #CCCCCC; font-weight: normal; }
+    QProgressBar#oil_progress::chunk {
+        background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #3498db, stop:0.5 #2ecc71, stop:1 #27ae60);
+        border-radius: 3px;
+    }
+    QProgressBar#oil_progress[state="high"]::chunk {
+        background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #3498db, stop:0.7 #f39c12, stop:1 #e67e22);
+    }
+    QProgressBar#oil_progress[state="warn"]::chunk {
+        background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #f39c12, stop:1 #e74c3c);
+    }
+    QProgressBar#oil_progress[state="cap"]::chunk { background-color: #CC0000; }
+    QProgressBar#oil_progress[state="disabled"]::chunk { background-color: #CCCCCC; }
+    QLabel#oil_status_label { color: #008800; }
+    QLabel#oil_status_label[state="high"] { color: #CC8800; }
+    QLabel#oil_status_label[state="warn"] { color: #CC8800; font-weight: bold; }
+    QLabel#oil_status_label[state="cap"] { color: #CC0000; font-weight: bold; }
+    QLabel#oil_status_label[state="disabled"] { color: #666666; }
+    
+    QGroupBox#quick_actions QPushButton { padding: 8px 15px; }
+    QPushButton#add_transaction_btn { background-color: #D5F5D5; }
+    QPushButton#roi_btn { background-color: #E8F4FD; }
+    QPushButton#budget_btn { background-color: #FFF2CC; }
+    QPushButton#inventory_btn { background-color: #E8E8E8; }
+    
+    QLabel#daily_income_label { color: #008800; font-weight: bold; }
+    QLabel#daily_expense_label { color: #cc0000; font-weight: bold; }
+    QLabel#daily_net_label { font-weight: bold; }
+    QLabel#daily_net_label[state="ok"] { color: #008800; }
+    QLabel#daily_net_label[state="low"] { color: #cc0000; }
+    
+    QPushButton#view_all_btn { color: #1F4E79; text-align: left; }
+"""
+
+
+def _set_state(widget, state):
+    """Switch a widget's "state" property and re-polish it if it changed."""
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+class RecentActivityModel(QAbstractTableModel):
+    """Read-only table model over the dashboard's most recent ledger rows.
+    
+    Each row is a ``(date, description, amount, account, balance, is_income)``
+    tuple of display strings; ``is_income`` is True/False to colour the amount,
+    or None when the row is neither income nor expense.
+    """
+    
+    HEADERS = ["Date", "Description", "Amount", "Account", "Balance"]
+    
+    COL_AMOUNT = 2
+    COL_BALANCE = 4
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple] = []
+    
+    def set_rows(self, rows: list[tuple]):
+        """Replace the backing row list."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = self._rows[index.row()]
+        col = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[col]
+        
+        if col in (self.COL_AMOUNT, self.COL_BALANCE):
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return _ALIGN_RIGHT_V
+            if role == Qt.ItemDataRole.ForegroundRole and col == self.COL_AMOUNT:
+                is_income = row[5]
+                if is_income is None:
+                    return None
+                return _COLOR_INCOME if is_income else _COLOR_EXPENSE
+        
+        return None
+
 
 class DashboardTab(QWidget):
     """Main Dashboard showing overview of all mining operations."""
@@ -17,10 +154,23 @@ class DashboardTab(QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
+        
+        # Ledger snapshot: revision it was taken at, and the balances then
+        self._ledger_revision = -1
+        self._balances: Optional[dict] = None
+        
+        # Coalesce bursts of refresh requests (tab switches, data signals)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
         self._setup_ui()
     
     def _setup_ui(self):
         """Set up the dashboard interface."""
+        self.setStyleSheet(_DASHBOARD_QSS)
+        
         # Use scroll area for smaller screens
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -65,7 +215,8 @@ class DashboardTab(QWidget):
         self.status_frame = QFrame()
         self.status_frame.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
         self.status_frame.setLineWidth(2)
-        self.status_frame.setStyleSheet("background-color: #D5F5D5;")  # Default green
+        self.status_frame.setObjectName("status_frame")
+        self.status_frame.setProperty("state", "ok")  # Default green
         
         status_layout = QHBoxLayout(self.status_frame)
         status_layout.setContentsMargins(15, 10, 15, 10)
@@ -120,11 +271,12 @@ class DashboardTab(QWidget):
         
         parent_layout.addLayout(cards_layout)
     
-    def _create_card(self, title, value, subtitle, color="#E8F4FD"):
-        """Create a summary card widget."""
+    def _create_card(self, title, value, subtitle, tone="blue"):
+        """Create a summary card widget (tone: blue, green or yellow)."""
         card = QFrame()
         card.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
-        card.setStyleSheet(f"background-color: {color}; border-radius: 5px;")
+        card.setObjectName("card")
+        card.setProperty("tone", tone)
         
         layout = QVBoxLayout(card)
         layout.setContentsMargins(15, 12, 15, 12)
@@ -137,13 +289,11 @@ class DashboardTab(QWidget):
         value_label = QLabel(value)
         value_label.setObjectName("value_label")
         value_label.setFont(QFont("", 18, QFont.Weight.Bold))
-        value_label.setStyleSheet("color: #1F4E79;")
         value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(value_label)
         
         subtitle_label = QLabel(subtitle)
         subtitle_label.setObjectName("subtitle_label")
-        subtitle_label.setStyleSheet("color: #666666;")
         subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle_label)
         
@@ -165,7 +315,7 @@ class DashboardTab(QWidget):
         
         self.oil_remaining_label = QLabel("Remaining: 10,000")
         self.oil_remaining_label.setFont(QFont("", 11))
-        self.oil_remaining_label.setStyleSheet("color: #666666;")
+        self.oil_remaining_label.setObjectName("oil_remaining_label")
         labels_layout.addWidget(self.oil_remaining_label)
         
         labels_layout.addStretch()
@@ -184,25 +334,15 @@ class DashboardTab(QWidget):
         self.oil_progress.setTextVisible(True)
         self.oil_progress.setFormat("%p% of lifetime cap")
         self.oil_progress.setMinimumHeight(30)
-        self.oil_progress.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #1F4E79;
-                border-radius: 5px;
-                text-align: center;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #3498db, stop:0.5 #2ecc71, stop:1 #27ae60);
-                border-radius: 3px;
-            }
-        """)
+        self.oil_progress.setObjectName("oil_progress")
+        self.oil_progress.setProperty("state", "ok")
         oil_layout.addWidget(self.oil_progress)
         
         # Status label
         self.oil_status_label = QLabel("✅ Within safe limits")
         self.oil_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.oil_status_label.setStyleSheet("color: #008800;")
+        self.oil_status_label.setObjectName("oil_status_label")
+        self.oil_status_label.setProperty("state", "ok")
         oil_layout.addWidget(self.oil_status_label)
         
         parent_layout.addWidget(oil_group)
@@ -210,30 +350,31 @@ class DashboardTab(QWidget):
     def _create_quick_actions(self, parent_layout):
         """Create quick action buttons."""
         actions_group = QGroupBox("⚡ Quick Actions")
+        actions_group.setObjectName("quick_actions")
         actions_layout = QHBoxLayout(actions_group)
         actions_layout.setSpacing(10)
         
         # Add Transaction button
         self.add_transaction_btn = QPushButton("➕ Add Transaction")
-        self.add_transaction_btn.setStyleSheet("background-color: #D5F5D5; padding: 8px 15px;")
+        self.add_transaction_btn.setObjectName("add_transaction_btn")
         self.add_transaction_btn.clicked.connect(self._go_to_ledger)
         actions_layout.addWidget(self.add_transaction_btn)
         
         # ROI Tracker button
         self.roi_btn = QPushButton("📊 ROI Tracker")
-        self.roi_btn.setStyleSheet("background-color: #E8F4FD; padding: 8px 15px;")
+        self.roi_btn.setObjectName("roi_btn")
         self.roi_btn.clicked.connect(self._go_to_roi_tracker)
         actions_layout.addWidget(self.roi_btn)
         
         # Budget Planner button
         self.budget_btn = QPushButton("📈 Budget Planner")
-        self.budget_btn.setStyleSheet("background-color: #FFF2CC; padding: 8px 15px;")
+        self.budget_btn.setObjectName("budget_btn")
         self.budget_btn.clicked.connect(self._go_to_budget_planner)
         actions_layout.addWidget(self.budget_btn)
         
         # Inventory button
         self.inventory_btn = QPushButton("📦 Inventory")
-        self.inventory_btn.setStyleSheet("background-color: #E8E8E8; padding: 8px 15px;")
+        self.inventory_btn.setObjectName("inventory_btn")
         self.inventory_btn.clicked.connect(self._go_to_inventory)
         actions_layout.addWidget(self.inventory_btn)
         
@@ -275,15 +416,15 @@ class DashboardTab(QWidget):
         
         # Daily summary labels
         self.daily_income_label = QLabel("Income: $0")
-        self.daily_income_label.setStyleSheet("color: #008800; font-weight: bold;")
+        self.daily_income_label.setObjectName("daily_income_label")
         date_row.addWidget(self.daily_income_label)
         
         self.daily_expense_label = QLabel("Expenses: $0")
-        self.daily_expense_label.setStyleSheet("color: #cc0000; font-weight: bold;")
+        self.daily_expense_label.setObjectName("daily_expense_label")
         date_row.addWidget(self.daily_expense_label)
         
         self.daily_net_label = QLabel("Net: $0")
-        self.daily_net_label.setStyleSheet("font-weight: bold;")
+        self.daily_net_label.setObjectName("daily_net_label")
         date_row.addWidget(self.daily_net_label)
         
         journal_layout.addLayout(date_row)
@@ -460,10 +601,10 @@ class DashboardTab(QWidget):
         net = total_income - total_expense
         if net >= 0:
             self.daily_net_label.setText(f"Net: +${net:,.0f}")
-            self.daily_net_label.setStyleSheet("font-weight: bold; color: #008800;")
+            _set_state(self.daily_net_label, "ok")
         else:
             self.daily_net_label.setText(f"Net: -${abs(net):,.0f}")
-            self.daily_net_label.setStyleSheet("font-weight: bold; color: #cc0000;")
+            _set_state(self.daily_net_label, "low")
         
         # Populate activities table
         self.activities_table.setRowCount(len(activities))
@@ -485,19 +626,19 @@ class DashboardTab(QWidget):
         roi_layout.setSpacing(15)
         
         # Top Performer Card
-        self.top_performer_card = self._create_card("🏆 TOP PERFORMER", "-", "+0% ROI", "#FFF2CC")
+        self.top_performer_card = self._create_card("🏆 TOP PERFORMER", "-", "+0% ROI", "yellow")
         self.top_performer_value = self.top_performer_card.findChild(QLabel, "value_label")
         self.top_performer_subtitle = self.top_performer_card.findChild(QLabel, "subtitle_label")
         roi_layout.addWidget(self.top_performer_card, 1)
         
         # Total Profit Card
-        self.total_profit_card = self._create_card("💰 TOTAL PROFIT", "$0", "From investments", "#D5F5D5")
+        self.total_profit_card = self._create_card("💰 TOTAL PROFIT", "$0", "From investments", "green")
         self.total_profit_value = self.total_profit_card.findChild(QLabel, "value_label")
         self.total_profit_subtitle = self.total_profit_card.findChild(QLabel, "subtitle_label")
         roi_layout.addWidget(self.total_profit_card, 1)
         
         # Success Rate Card
-        self.success_rate_card = self._create_card("✅ SUCCESS RATE", "0%", "0 of 0 profitable", "#E8F4FD")
+        self.success_rate_card = self._create_card("✅ SUCCESS RATE", "0%", "0 of 0 profitable", "blue")
         self.success_rate_value = self.success_rate_card.findChild(QLabel, "value_label")
         self.success_rate_subtitle = self.success_rate_card.findChild(QLabel, "subtitle_label")
         roi_layout.addWidget(self.success_rate_card, 1)
@@ -510,41 +651,67 @@ class DashboardTab(QWidget):
         activity_layout = QVBoxLayout(activity_group)
         
         # Table
-        self.activity_table = QTableWidget()
-        self.activity_table.setColumnCount(5)
-        self.activity_table.setHorizontalHeaderLabels([
-            "Date", "Description", "Amount", "Account", "Balance"
-        ])
+        self.activity_model = RecentActivityModel(self)
+        self.activity_table = QTableView()
+        self.activity_table.setModel(self.activity_model)
         self.activity_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.activity_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
         self.activity_table.setColumnWidth(1, 250)
         self.activity_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.activity_table.setAlternatingRowColors(True)
         self.activity_table.setMaximumHeight(200)
+        self.activity_table.verticalHeader().setDefaultSectionSize(22)
         activity_layout.addWidget(self.activity_table)
         
         # Link to Ledger
         view_all_btn = QPushButton("View All Transactions →")
         view_all_btn.setFlat(True)
-        view_all_btn.setStyleSheet("color: #1F4E79; text-align: left;")
+        view_all_btn.setObjectName("view_all_btn")
         view_all_btn.clicked.connect(self._go_to_ledger)
         activity_layout.addWidget(view_all_btn)
         
         parent_layout.addWidget(activity_group)
     
     def refresh_dashboard(self):
+        """Schedule a dashboard refresh; repeated calls within 50 ms share one."""
+        self._refresh_timer.start()
+    
+    def _do_refresh(self):
         """Refresh all dashboard data."""
-        self._update_financial_summary()
+        # Not visible: showEvent schedules a refresh when the tab comes back
+        if not self.isVisible():
+            return
+        
+        # Ledger-only sections are skipped while the ledger is unchanged
+        if self._refresh_ledger_snapshot():
+            self._update_financial_summary(self._balances)
+            self._update_recent_activity()
         self._update_oil_progress()
         self._update_roi_highlights()
-        self._update_recent_activity()
-        self._update_status_banner()
+        self._update_status_banner(self._balances)
+    
+    def _refresh_ledger_snapshot(self) -> bool:
+        """Re-read ledger balances if the ledger changed since the last refresh.
+        
+        Returns True when the snapshot was taken again.
+        """
+        try:
+            ledger = self.main_window.ledger_tab
+            revision = getattr(ledger, 'revision', None)
+            if revision is not None and revision == self._ledger_revision:
+                return False
+            self._balances = ledger.get_current_balances()
+            self._ledger_revision = revision
+        except Exception as e:
+            print(f"Error reading ledger balances: {e}")
+            self._balances = None
+            self._ledger_revision = -1
+        return True
     
-    def _update_financial_summary(self):
-        """Update financial summary cards from Ledger."""
+    def _update_financial_summary(self, balances):
+        """Update financial summary cards from Ledger balances."""
         try:
             ledger = self.main_window.ledger_tab
-            balances = ledger.get_current_balances()
             
             personal = balances.get("personal", 0)
             company = balances.get("company", 0)
@@ -561,11 +728,11 @@ class DashboardTab(QWidget):
             
             # Color code net worth based on starting capital
             if total >= 100000:
-                self.networth_value.setStyleSheet("color: #008800;")
+                _set_state(self.networth_value, "ok")
             elif total >= 50000:
-                self.networth_value.setStyleSheet("color: #1F4E79;")
+                _set_state(self.networth_value, None)
             else:
-                self.networth_value.setStyleSheet("color: #CC0000;")
+                _set_state(self.networth_value, "low")
                 
         except Exception as e:
             print(f"Error updating financial summary: {e}")
@@ -598,81 +765,24 @@ class DashboardTab(QWidget):
                 # Update status and colors
                 if not oil_enabled:
                     self.oil_status_label.setText("⚪ Oil cap tracking disabled")
-                    self.oil_status_label.setStyleSheet("color: #666666;")
-                    self.oil_progress.setStyleSheet("""
-                        QProgressBar {
-                            border: 2px solid #CCCCCC;
-                            border-radius: 5px;
-                            text-align: center;
-                        }
-                        QProgressBar::chunk {
-                            background-color: #CCCCCC;
-                            border-radius: 3px;
-                        }
-                    """)
+                    _set_state(self.oil_status_label, "disabled")
+                    _set_state(self.oil_progress, "disabled")
                 elif oil_sold >= oil_cap:
                     self.oil_status_label.setText("🚨 OIL CAP REACHED - No more sales allowed!")
-                    self.oil_status_label.setStyleSheet("color: #CC0000; font-weight: bold;")
-                    self.oil_progress.setStyleSheet("""
-                        QProgressBar {
-                            border: 2px solid #CC0000;
-                            border-radius: 5px;
-                            text-align: center;
-                            font-weight: bold;
-                        }
-                        QProgressBar::chunk {
-                            background-color: #CC0000;
-                            border-radius: 3px;
-                        }
-                    """)
+                    _set_state(self.oil_status_label, "cap")
+                    _set_state(self.oil_progress, "cap")
                 elif oil_sold >= oil_cap * 0.9:
                     self.oil_status_label.setText("⚠️ WARNING: Approaching oil cap limit!")
-                    self.oil_status_label.setStyleSheet("color: #CC8800; font-weight: bold;")
-                    self.oil_progress.setStyleSheet("""
-                        QProgressBar {
-                            border: 2px solid #CC8800;
-                            border-radius: 5px;
-                            text-align: center;
-                            font-weight: bold;
-                        }
-                        QProgressBar::chunk {
-                            background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                stop:0 #f39c12, stop:1 #e74c3c);
-                            border-radius: 3px;
-                        }
-                    """)
+                    _set_state(self.oil_status_label, "warn")
+                    _set_state(self.oil_progress, "warn")
                 elif oil_sold >= oil_cap * 0.75:
                     self.oil_status_label.setText("⚠️ 75% of oil cap used")
-                    self.oil_status_label.setStyleSheet("color: #CC8800;")
-                    self.oil_progress.setStyleSheet("""
-                        QProgressBar {
-                            border: 2px solid #1F4E79;
-                            border-radius: 5px;
-                            text-align: center;
-                            font-weight: bold;
-                        }
-                        QProgressBar::chunk {
-                            background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                stop:0 #3498db, stop:0.7 #f39c12, stop:1 #e67e22);
-                            border-radius: 3px;
-                        }
-                    """)
+                    _set_state(self.oil_status_label, "high")
+                    _set_state(self.oil_progress, "high")
                 else:
                     self.oil_status_label.setText("✅ Within safe limits")
-                    self.oil_status_label.setStyleSheet("color: #008800;")
-                    self.oil_progress.setStyleSheet("""
-                        QProgressBar {
-                            border: 2px solid #1F4E79;
-                            border-radius: 5px;
-                            text-align: center;
-                            font-weight: bold;
-                        }
-                        QProgressBar::chunk {
-                            background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                stop:0 #3498db, stop:0.5 #2ecc71, stop:1 #27ae60);
-                            border-radius: 3px;
-                        }
-                    """)
+                    _set_state(self.oil_status_label, "ok")
+                    _set_state(self.oil_progress, "ok")
                     
         except Exception as e:
             print(f"Error updating oil progress: {e}")
@@ -693,9 +803,9 @@ class DashboardTab(QWidget):
                 net_profit = roi_data.get("net_profit", 0)
                 self.total_profit_value.setText(f"${net_profit:+,.0f}")
                 if net_profit >= 0:
-                    self.total_profit_value.setStyleSheet("color: #008800;")
+                    _set_state(self.total_profit_value, "ok")
                 else:
-                    self.total_profit_value.setStyleSheet("color: #CC0000;")
+                    _set_state(self.total_profit_value, "low")
                 
                 overall_roi = roi_data.get("overall_roi", 0)
                 self.total_profit_subtitle.setText(f"{overall_roi:+.1f}% overall ROI")
@@ -721,72 +831,47 @@ class DashboardTab(QWidget):
             real_transactions = row_count - 1  # Exclude Opening Balance
             display_count = min(5, max(0, real_transactions))
             
-            self.activity_table.setRowCount(display_count)
-            
-            running_balance = 0
-            balances = ledger.get_current_balances()
+            def cell_text(ledger_row, col):
+                item = ledger.table.item(ledger_row, col)
+                return item.text() if item else ""
             
+            rows = []
             for i in range(display_count):
                 # Get from bottom of ledger (most recent), skip row 0 (Opening Balance)
                 ledger_row = row_count - 1 - i
                 if ledger_row == 0:  # Skip Opening Balance row
                     continue
                 
-                # Date
-                date_item = ledger.table.item(ledger_row, 0)
-                date_text = date_item.text() if date_item else ""
-                self.activity_table.setItem(i, 0, QTableWidgetItem(date_text))
-                
-                # Description
-                desc_item = ledger.table.item(ledger_row, 2)
-                desc_text = desc_item.text() if desc_item else ""
-                self.activity_table.setItem(i, 1, QTableWidgetItem(desc_text))
-                
-                # Amount (Total column - col 8, or use Personal Income/Expense)
-                # For sales: show Personal Income (col 9)
-                # For purchases/fuel: show Personal Expense (col 11)
-                personal_income = ledger.table.item(ledger_row, 9)
-                personal_expense = ledger.table.item(ledger_row, 11)
-                
-                income_text = personal_income.text() if personal_income else ""
-                expense_text = personal_expense.text() if personal_expense else ""
-                
-                if income_text and income_text != "$0" and income_text != "":
-                    amount_item = QTableWidgetItem(income_text)
-                    amount_item.setForeground(QColor("#008800"))
-                elif expense_text and expense_text != "$0" and expense_text != "":
-                    amount_item = QTableWidgetItem(expense_text)
-                    amount_item.setForeground(QColor("#CC0000"))
+                # Amount: Personal Income (col 9) for sales, Personal Expense
+                # (col 11) for purchases/fuel, else the Total column (col 8)
+                income_text = cell_text(ledger_row, 9)
+                expense_text = cell_text(ledger_row, 11)
+                if income_text and income_text != "$0":
+                    amount_text, is_income = income_text, True
+                elif expense_text and expense_text != "$0":
+                    amount_text, is_income = expense_text, False
                 else:
-                    # Fallback to Total column
-                    total_item = ledger.table.item(ledger_row, 8)
-                    amount_item = QTableWidgetItem(total_item.text() if total_item else "$0")
+                    amount_text, is_income = cell_text(ledger_row, 8) or "$0", None
                 
-                amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                self.activity_table.setItem(i, 2, amount_item)
-                
-                # Account (col 13)
-                account_item = ledger.table.item(ledger_row, 13)
-                account_text = account_item.text() if account_item else ""
-                self.activity_table.setItem(i, 3, QTableWidgetItem(account_text))
-                
-                # Balance - Personal Balance (col 16)
-                balance_item = ledger.table.item(ledger_row, 16)
-                balance_text = balance_item.text() if balance_item else ""
-                balance_cell = QTableWidgetItem(balance_text)
-                balance_cell.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                self.activity_table.setItem(i, 4, balance_cell)
+                rows.append((
+                    cell_text(ledger_row, 0),   # Date
+                    cell_text(ledger_row, 2),   # Description
+                    amount_text,
+                    cell_text(ledger_row, 13),  # Account
+                    cell_text(ledger_row, 16),  # Personal Balance
+                    is_income,
+                ))
+            
+            self.activity_model.set_rows(rows)
                 
         except Exception as e:
             print(f"Error updating recent activity: {e}")
-            self.activity_table.setRowCount(0)
+            self.activity_model.set_rows([])
     
-    def _update_status_banner(self):
+    def _update_status_banner(self, balances):
         """Update the status banner based on current state."""
         try:
             # Get financial data
-            ledger = self.main_window.ledger_tab
-            balances = ledger.get_current_balances()
             total = balances.get("personal", 0) + balances.get("company", 0)
             
             # Check budget status
@@ -815,24 +900,24 @@ class DashboardTab(QWidget):
             if total >= 100000 and can_afford:
                 self.status_icon.setText("✅")
                 self.status_label.setText("ALL SYSTEMS OPERATIONAL")
-                self.status_frame.setStyleSheet("background-color: #D5F5D5;")
+                _set_state(self.status_frame, "ok")
             elif total >= 50000 and can_afford:
                 self.status_icon.setText("✅")
                 self.status_label.setText("OPERATIONS NORMAL")
-                self.status_frame.setStyleSheet("background-color: #D5F5D5;")
+                _set_state(self.status_frame, "ok")
             elif not can_afford:
                 self.status_icon.setText("⚠️")
                 self.status_label.setText("OVER BUDGET - Review Budget Planner")
-                self.status_frame.setStyleSheet("background-color: #FFF2CC;")
+                _set_state(self.status_frame, "warn")
             elif total < 50000:
                 self.status_icon.setText("⚠️")
                 self.status_label.setText("LOW FUNDS - Consider selling assets")
-                self.status_frame.setStyleSheet("background-color: #FFF2CC;")
+                _set_state(self.status_frame, "warn")
             
             if total < 10000:
                 self.status_icon.setText("🚨")
                 self.status_label.setText("CRITICAL - Funds dangerously low!")
-                self.status_frame.setStyleSheet("background-color: #F8D6D6;")
+                _set_state(self.status_frame, "crit")
             
             # Update day counter (placeholder - could be from settings)
             self.day_label.setText("Day: 1")
@@ -841,33 +926,25 @@ class DashboardTab(QWidget):
             print(f"Error updating status banner: {e}")
             self.status_label.setText("Dashboard Ready")
     
+    def _go_to_tab(self, tab_id):
+        """Switch the main window to the tab with the given ID."""
+        self.main_window.tab_widget.setCurrentIndex(TAB_INDEX[tab_id])
+    
     def _go_to_ledger(self):
         """Navigate to Ledger tab."""
-        for i in range(self.main_window.tab_widget.count()):
-            if self.main_window.tab_widget.tabText(i) == "Ledger":
-                self.main_window.tab_widget.setCurrentIndex(i)
-                break
+        self._go_to_tab("ledger")
     
     def _go_to_roi_tracker(self):
         """Navigate to ROI Tracker tab."""
-        for i in range(self.main_window.tab_widget.count()):
-            if self.main_window.tab_widget.tabText(i) == "ROI Tracker":
-                self.main_window.tab_widget.setCurrentIndex(i)
-                break
+        self._go_to_tab("roi_tracker")
     
     def _go_to_budget_planner(self):
         """Navigate to Budget Planner tab."""
-        for i in range(self.main_window.tab_widget.count()):
-            if self.main_window.tab_widget.tabText(i) == "Budget Planner":
-                self.main_window.tab_widget.setCurrentIndex(i)
-                break
+        self._go_to_tab("budget_planner")
     
     def _go_to_inventory(self):
         """Navigate to Inventory tab."""
-        for i in range(self.main_window.tab_widget.count()):
-            if self.main_window.tab_widget.tabText(i) == "Inventory":
-                self.main_window.tab_widget.setCurrentIndex(i)
-                break
+        self._go_to_tab("inventory")
     
     def showEvent(self, event):
         """Refresh dashboard when tab is shown."""
@@ -72,6 +72,10 @@ class LedgerTab(QWidget):
         # Transaction data
         self.transactions: list[dict] = []
         
+        # Bumped on every change to the table (see _bump_revision); lets
+        # readers such as the Dashboard skip re-reads while it is unchanged
+        self.revision = 0
+        
         # Undo/Redo stacks
         self.undo_stack: list[dict] = []  # Stack of {action, data, index}
         self.redo_stack: list[dict] = []
@@ -111,10 +115,22 @@ class LedgerTab(QWidget):
         self.table = self._create_table()
         layout.addWidget(self.table)
         
+        # Watch the model itself so writes from outside this class (session
+        # load / New Session) also bump the revision
+        model = self.table.model()
+        model.rowsInserted.connect(self._bump_revision)
+        model.rowsRemoved.connect(self._bump_revision)
+        model.modelReset.connect(self._bump_revision)
+        model.dataChanged.connect(self._bump_revision)
+        
         # Bottom section: Transaction count
         self.status_label = QLabel("Transactions: 0")
         layout.addWidget(self.status_label)
     
+    def _bump_revision(self, *args):
+        """Mark the table as changed (slot for the table model's signals)."""
+        self.revision += 1
+    
     def _create_opening_balance_group(self) -> QGroupBox:
         """Create the opening balance controls."""
         group = QGroupBox("💰 Opening Balance (Row 1)")